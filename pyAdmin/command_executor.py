@@ -1,14 +1,140 @@
 """Windows command executor with scheduling and real-time output capabilities."""
 
+import codecs
+import functools
+import heapq
 import subprocess
 import shutil
 import logging
+import logging.handlers
+import queue
+import selectors
+import shlex
+import signal
 import threading
 import os
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional, Callable, Any
+from types import MappingProxyType
+from typing import List, Tuple, Dict, Optional, Callable, Any, Iterator, IO, Mapping
+
+# Characters with special meaning to sh or cmd.exe; commands containing any
+# of them are never emulated in-process
+_SHELL_SPECIAL = frozenset('|&;<>()$`\\"\'*?[]{}~%!^#\r\n')
+# Lines buffered between the pipe reader thread and output_callback
+_OUTPUT_QUEUE_SIZE = 1024
+# Scheduler deadlines are kept in time.monotonic_ns() units
+_NS_PER_SECOND = 1_000_000_000
+# Shortest pause between the end of an interval task run and its next start
+_MIN_REARM_NS = 10_000_000
+# Keys every scheduled task dictionary must contain
+_REQUIRED_TASK_KEYS = frozenset({
+    'type', 'command', 'active',
+    'last_run', 'max_runs', 'run_count'
+})
+
+
+@functools.lru_cache(maxsize=512)
+def _which_cached(cmd: str, path: str) -> Optional[str]:
+    """Locate executable in given search path, memoized per (cmd, path)."""
+    return shutil.which(cmd, path=path)
+
+
+class _PersistentShell:
+    """Long-lived POSIX shell that runs commands sent over its stdin.
+
+    Every command runs in its own subshell with stdin from /dev/null, so
+    directory changes, variables and ``exit`` do not leak into later
+    commands. Output is framed by a random marker echoed after the command
+    on both stdout and stderr. Commands are executed one at a time.
+    """
+
+    def __init__(self, env: Dict[str, str]) -> None:
+        self.env = env
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+
+    def run(self, command: str, cwd: str, timeout: Optional[float]) -> Tuple[bytes, bytes, int]:
+        """Run command and return raw stdout, stderr and exit code.
+
+        Raises:
+            subprocess.TimeoutExpired: If command did not finish in time;
+                the shell and everything it started is killed
+            RuntimeError: If the shell exited unexpectedly
+        """
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._process = subprocess.Popen(
+                    ["/bin/sh"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=self.env,
+                    start_new_session=True
+                )
+            marker = uuid.uuid4().hex.encode()
+            script = (
+                f"( cd -- {shlex.quote(cwd)} && eval {shlex.quote(command)} ) </dev/null\n"
+                f"printf '\\n%s %d\\n' {marker.decode()} \"$?\"\n"
+                f"printf '\\n%s\\n' {marker.decode()} >&2\n"
+            )
+            try:
+                self._process.stdin.write(script.encode())
+                self._process.stdin.flush()
+                return self._read_until(marker, timeout)
+            except BaseException:
+                self._kill()
+                raise
+
+    def close(self) -> None:
+        """Terminate the shell if it is running."""
+        with self._lock:
+            self._kill()
+
+    def _read_until(self, marker: bytes, timeout: Optional[float]) -> Tuple[bytes, bytes, int]:
+        """Internal: Collect both pipes until the end markers arrive."""
+        out_end = b"\n" + marker + b" "
+        err_end = b"\n" + marker + b"\n"
+        buffers = {self._process.stdout.fileno(): bytearray(),
+                   self._process.stderr.fileno(): bytearray()}
+        out_fd, err_fd = buffers
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with selectors.DefaultSelector() as selector:
+            for fd in buffers:
+                selector.register(fd, selectors.EVENT_READ)
+            while True:
+                out = buffers[out_fd]
+                pos = out.rfind(out_end)
+                if pos >= 0 and out.endswith(b"\n") and buffers[err_fd].endswith(err_end):
+                    code = int(out[pos + len(out_end):-1])
+                    return bytes(out[:pos]), bytes(buffers[err_fd][:-len(err_end)]), code
+
+                wait = None if deadline is None else deadline - time.monotonic()
+                if wait is not None and wait <= 0:
+                    raise subprocess.TimeoutExpired("persistent shell", timeout)
+                ready = selector.select(wait)
+                for key, _ in ready:
+                    chunk = os.read(key.fd, 65536)
+                    if not chunk:
+                        raise RuntimeError("persistent shell exited")
+                    buffers[key.fd] += chunk
+
+    def _kill(self) -> None:
+        """Internal: Kill shell process group and release pipes."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        process.wait()
+        for stream in (process.stdin, process.stdout, process.stderr):
+            stream.close()
 
 
 class CommandExecutor:
@@ -42,16 +168,43 @@ class CommandExecutor:
         self._init_logger(log_file)
         self.env_vars = {}
         self.working_dir = Path.cwd()
+        self._working_dir_str = str(self.working_dir)
+        self._rebuild_env()
         self.scheduled_tasks = {}
         self.task_id_counter = 0
+        self._task_heap = []
+        self._lock = threading.Lock()
+        # Signalled when a task becomes the earliest one or the scheduler stops
+        self._cv = threading.Condition(self._lock)
+        # Bumped on every task change; get_scheduled_tasks reuses its last
+        # snapshot while the version is unchanged
+        self._tasks_version = 0
+        self._snapshot_version = -1
+        self._tasks_snapshot = {}
         self.scheduler_thread = None
         self.stop_scheduler = threading.Event()
+        self._task_pool = ThreadPoolExecutor(
+            max_workers=8,
+            thread_name_prefix="TaskExecutor"
+        )
+        # Submitted runs not finished yet, cancelled by close() if still queued
+        self._task_futures = set()
         self.encoding = 'cp866'
+        self._shell: Optional[_PersistentShell] = None
+        self._shell_lock = threading.Lock()
+        self._builtin_handlers = {
+            'echo': self._builtin_echo,
+            'cd': self._builtin_cd
+        }
         self.logger.info("CommandExecutor initialized")
 
     def _init_logger(self, log_file: str) -> None:
         """Configure logging handlers with file and console outputs.
 
+        Records are put on a queue and written by a background listener
+        that owns the file and console handlers, so logging calls made from
+        command and scheduler threads do not wait on I/O.
+
         Args:
             log_file (str): Path to log file
         """
@@ -65,20 +218,38 @@ class CommandExecutor:
         )
         file_handler.setFormatter(file_formatter)
 
+        # Buffer file writes; errors and above are written out immediately
+        self._log_mem_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+
         # Console handler with simple format
         console_handler = logging.StreamHandler()
         console_formatter = logging.Formatter("%(levelname)s - %(message)s")
         console_handler.setFormatter(console_formatter)
 
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        self._log_queue = queue.Queue(-1)
+        self._log_handler = logging.handlers.QueueHandler(self._log_queue)
+        self._log_listener = logging.handlers.QueueListener(
+            self._log_queue,
+            self._log_mem_handler,
+            console_handler,
+            respect_handler_level=True
+        )
+        self._log_listener.start()
+        self.logger.addHandler(self._log_handler)
 
     def execute_command(
         self,
         command: str,
         cwd: Optional[str] = None,
         timeout: Optional[int] = None,
-        shell: bool = True
+        shell: bool = True,
+        allow_builtins: bool = True,
+        persistent: bool = False
     ) -> Tuple[str, str, int]:
         r"""Execute a single shell command with proper error handling.
 
@@ -87,6 +258,18 @@ class CommandExecutor:
             cwd (str, optional): Working directory. Default: current directory
             timeout (int, optional): Maximum execution time in seconds
             shell (bool): Use shell interpreter. Recommended for Windows
+            allow_builtins (bool): Answer plain ``echo`` and successful
+                ``cd <dir>`` calls in-process instead of starting a shell.
+                Only used with shell=True and commands without shell
+                special characters
+            persistent (bool): Send the command to a long-lived /bin/sh
+                instead of spawning a new shell (POSIX only, shell=True).
+                Each command still runs in its own subshell, so state does
+                not leak between calls; commands from several threads are
+                run one after another
+
+        The process environment is merged with custom variables once, on
+        initialization and on every set_environment/reset_environment call.
 
         Returns:
             Tuple[str, str, int]:
@@ -103,21 +286,35 @@ class CommandExecutor:
             >>> executor.execute_command("invalid_command")
             ('', 'Execution failed: invalid_command - ...', -1)
         """
-        self.logger.debug(f"Executing command: {command}")
+        self.logger.debug("Executing command: %s", command)
+        # A missing cwd must fail the way subprocess does, so leave it to the shell
+        if shell and allow_builtins and (cwd is None or os.path.isdir(cwd)):
+            result = self._run_builtin(command, cwd or self._working_dir_str)
+            if result is not None:
+                self.logger.info("Command executed: %s Code: %s", command, result[2])
+                return result
+
         try:
-            process = subprocess.run(
-                command,
-                cwd=cwd or str(self.working_dir),
-                env={**os.environ, **self.env_vars},
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                shell=shell,
-                encoding=self.encoding,
-                errors='replace'
-            )
-            self.logger.info(f"Command executed: {command} Code: {process.returncode}")
-            return (process.stdout, process.stderr, process.returncode)
+            if persistent and shell and os.name == 'posix':
+                out, err, code = self._get_shell().run(
+                    command, cwd or self._working_dir_str, timeout
+                )
+                result = (self._decode_output(out), self._decode_output(err), code)
+            else:
+                process = subprocess.run(
+                    command,
+                    cwd=cwd or self._working_dir_str,
+                    env=self._env_cache,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    shell=shell,
+                    encoding=self.encoding,
+                    errors='replace'
+                )
+                result = (process.stdout, process.stderr, process.returncode)
+            self.logger.info("Command executed: %s Code: %s", command, result[2])
+            return result
         except subprocess.TimeoutExpired:
             error_msg = f"Command timed out: {command}"
             self.logger.error(error_msg)
@@ -152,15 +349,18 @@ class CommandExecutor:
             ('First\\r\\n', '', 0)
         """
         results = []
-        self.logger.info(f"Executing command sequence ({len(commands)} commands)")
+        total = len(commands)
+        self.logger.info("Executing command sequence (%d commands)", total)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         for idx, cmd in enumerate(commands, 1):
-            self.logger.debug(f"Executing command {idx}/{len(commands)}: {cmd}")
+            if debug:
+                self.logger.debug("Executing command %d/%d: %s", idx, total, cmd)
             result = self.execute_command(cmd, **kwargs)
             results.append(result)
 
             if stop_on_error and result[2] != 0:
-                self.logger.warning(f"Stopped sequence on failed command: {cmd}")
+                self.logger.warning("Stopped sequence on failed command: %s", cmd)
                 break
 
         return results
@@ -175,9 +375,12 @@ class CommandExecutor:
     ) -> int:
         """Schedule periodic command execution.
 
+        The interval is counted from the end of the previous run, so runs of
+        one task never overlap and a slow command cannot queue up a backlog.
+
         Args:
             command (str): Command to execute periodically
-            interval (int): Execution interval in seconds
+            interval (int): Execution interval in seconds, must be positive
             immediate_run (bool): Run immediately after scheduling
             max_runs (int): Maximum number of executions (None = infinite)
             callback (Callable): Function to call after each execution with signature:
@@ -186,6 +389,9 @@ class CommandExecutor:
         Returns:
             int: Unique task ID
 
+        Raises:
+            ValueError: If interval is not positive
+
         Examples:
             >>> def callback(out, err, code):
             ...     print(f"Task completed with code {code}")
@@ -196,7 +402,8 @@ class CommandExecutor:
             ...     callback=callback
             ... )
         """
-        self.task_id_counter += 1
+        if interval <= 0:
+            raise ValueError(f"Interval must be positive, got {interval}")
         task = {
             'type': 'interval',
             'command': command,
@@ -205,18 +412,21 @@ class CommandExecutor:
             'run_count': 0,
             'callback': callback,
             'last_run': 0,
+            'running': False,
             'active': True
         }
-        self.scheduled_tasks[self.task_id_counter] = task
-        self.logger.info(f"Scheduled interval task {self.task_id_counter}: {command}")
+        # Never run yet, so unless run right here the task is due on the
+        # first scheduler pass
+        task_id = self._register_task(task, None if immediate_run else time.monotonic_ns())
+        self.logger.info("Scheduled interval task %s: %s", task_id, command)
 
         if immediate_run:
-            self._trigger_task(self.task_id_counter)
+            self._trigger_task(task_id)
 
         if not self.scheduler_thread:
             self._start_scheduler()
 
-        return self.task_id_counter
+        return task_id
 
     def schedule_at(
         self,
@@ -240,30 +450,35 @@ class CommandExecutor:
             >>> run_time = datetime.now() + timedelta(minutes=5)
             >>> task_id = executor.schedule_at("echo Timed", run_time)
         """
-        self.task_id_counter += 1
         task = {
             'type': 'at',
             'command': command,
             'execution_time': execution_time.timestamp(),
             'callback': callback,
             'fired': False,
+            'running': False,
             'active': True,
             'interval': 0,
             'last_run': 0,
             'max_runs': 1,
             'run_count': 0
         }
-        self.scheduled_tasks[self.task_id_counter] = task
-        self.logger.info(f"Scheduled timed task {self.task_id_counter}: {command}")
+        # Wall-clock target mapped onto the monotonic scheduler clock once
+        delay_ns = int((task['execution_time'] - time.time()) * _NS_PER_SECOND)
+        task_id = self._register_task(task, time.monotonic_ns() + delay_ns)
+        self.logger.info("Scheduled timed task %s: %s", task_id, command)
 
         if not self.scheduler_thread:
             self._start_scheduler()
 
-        return self.task_id_counter
+        return task_id
 
     def validate_command(self, command: str) -> bool:
         """Verify if command is available in system PATH.
 
+        Lookups are cached per PATH value; call clear_command_cache after
+        installing or removing programs without changing PATH.
+
         Args:
             command (str): Command to check (uses first token only)
 
@@ -278,10 +493,21 @@ class CommandExecutor:
             False
         """
         cmd = command.split()[0]
-        exists = shutil.which(cmd) is not None
-        self.logger.debug(f"Command validation: {cmd} -> {'Exists' if exists else 'Not found'}")
+        exists = _which_cached(cmd, os.environ.get('PATH', os.defpath)) is not None
+        self.logger.debug(
+            "Command validation: %s -> %s", cmd, 'Exists' if exists else 'Not found'
+        )
         return exists
 
+    def clear_command_cache(self) -> None:
+        """Forget cached validate_command lookups.
+
+        Examples:
+            >>> executor.clear_command_cache()
+        """
+        _which_cached.cache_clear()
+        self.logger.debug("Command lookup cache cleared")
+
     def set_environment(self, env_vars: Dict[str, str]) -> None:
         """Update execution environment variables.
 
@@ -292,7 +518,8 @@ class CommandExecutor:
             >>> executor.set_environment({"PYTHONPATH": "/custom/path", "DEBUG": "1"})
         """
         self.env_vars.update(env_vars)
-        self.logger.info(f"Updated environment variables: {list(env_vars.keys())}")
+        self._rebuild_env()
+        self.logger.info("Updated environment variables: %s", list(env_vars.keys()))
 
     def realtime_output(
         self,
@@ -321,7 +548,7 @@ class CommandExecutor:
             ... )
             0
         """
-        self.logger.info(f"Starting realtime execution: {command}")
+        self.logger.info("Starting realtime execution: %s", command)
         try:
             if admin:
                 self.logger.debug("Elevating privileges for command")
@@ -329,42 +556,32 @@ class CommandExecutor:
                     f'Start-Process cmd -Verb RunAs -ArgumentList "/c {command}" '
                     '-WindowStyle Hidden -Wait'
                 )
+                # argv list is passed to powershell directly, without an extra
+                # cmd.exe layer; -NoProfile skips loading user profile scripts
                 process = subprocess.Popen(
-                    ["powershell", "-Command", full_command],
+                    ["powershell", "-NoProfile", "-Command", full_command],
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    shell=True,
-                    encoding=self.encoding,
-                    errors='replace',
-                    bufsize=1,
-                    universal_newlines=True
+                    stderr=subprocess.STDOUT
                 )
             else:
                 process = subprocess.Popen(
                     command,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    shell=True,
-                    encoding=self.encoding,
-                    errors='replace',
-                    bufsize=1,
-                    universal_newlines=True
+                    shell=True
                 )
 
-            while True:
-                output = process.stdout.readline()
-                if not output and process.poll() is not None:
-                    break
-                if output:
-                    self.logger.debug(f"Realtime output: {output.strip()}")
-                    output_callback(output.strip())
-
-            return_code = process.returncode
-            self.logger.info(f"Realtime execution completed. Code: {return_code}")
+            for line in self._consume_output(process.stdout):
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Realtime output: %s", line)
+                output_callback(line)
+
+            return_code = process.wait()
+            self.logger.info("Realtime execution completed. Code: %s", return_code)
             return return_code
 
         except Exception as e:
-            self.logger.error(f"Realtime execution failed: {str(e)}", exc_info=True)
+            self.logger.error("Realtime execution failed: %s", e, exc_info=True)
             return -1
 
     def remove_scheduled_task(self, task_id: int) -> bool:
@@ -381,11 +598,15 @@ class CommandExecutor:
             >>> executor.remove_scheduled_task(task_id)
             True
         """
-        if task_id in self.scheduled_tasks:
-            del self.scheduled_tasks[task_id]
-            self.logger.info(f"Removed task {task_id}")
+        with self._lock:
+            removed = self.scheduled_tasks.pop(task_id, None) is not None
+            if removed:
+                self._tasks_version += 1
+
+        if removed:
+            self.logger.info("Removed task %s", task_id)
             return True
-        self.logger.warning(f"Task {task_id} not found for removal")
+        self.logger.warning("Task %s not found for removal", task_id)
         return False
 
     def pause_scheduler(self) -> None:
@@ -397,6 +618,7 @@ class CommandExecutor:
             {}
         """
         self.stop_scheduler.set()
+        self._wake_scheduler()
         self.logger.info("Scheduler paused")
 
         if self.scheduler_thread and self.scheduler_thread.is_alive():
@@ -421,11 +643,17 @@ class CommandExecutor:
         self._start_scheduler()
         self.logger.info("Scheduler resumed")
 
-    def get_scheduled_tasks(self) -> Dict[int, Dict[str, Any]]:
+    def get_scheduled_tasks(self) -> Dict[int, Mapping[str, Any]]:
         """Get snapshot of currently scheduled tasks.
 
+        The snapshot is rebuilt only after tasks change. Task entries are
+        read-only views of per-snapshot copies, so they can be shared
+        between the snapshots taken in the meantime without one caller's
+        changes leaking into another's.
+
         Returns:
-            Dict[int, Dict]: Copy of tasks dictionary
+            Dict[int, Mapping]: Copy of tasks dictionary with read-only
+                task entries
 
         Examples:
             >>> tasks = executor.get_scheduled_tasks()
@@ -433,7 +661,13 @@ class CommandExecutor:
             dict_keys([1, 2])
         """
         self.logger.debug("Returning tasks snapshot")
-        return {k: v.copy() for k, v in self.scheduled_tasks.items()}
+        with self._lock:
+            if self._snapshot_version != self._tasks_version:
+                self._tasks_snapshot = {
+                    k: MappingProxyType(v.copy()) for k, v in self.scheduled_tasks.items()
+                }
+                self._snapshot_version = self._tasks_version
+            return dict(self._tasks_snapshot)
 
     def set_working_directory(self, path: str) -> None:
         """Update default working directory for command execution.
@@ -455,7 +689,8 @@ class CommandExecutor:
 
         new_path.mkdir(exist_ok=True, parents=True)
         self.working_dir = new_path.resolve()
-        self.logger.info(f"Updated working directory to: {self.working_dir}")
+        self._working_dir_str = str(self.working_dir)
+        self.logger.info("Updated working directory to: %s", self.working_dir)
 
     def export_environment(self) -> Dict[str, str]:
         """Get current environment variables configuration.
@@ -479,88 +714,356 @@ class CommandExecutor:
             {}
         """
         self.env_vars.clear()
+        self._rebuild_env()
         self.logger.info("Environment variables reset")
 
+    def close(self) -> None:
+        """Stop scheduler and flush pending log records.
+
+        The executor should not be used after closing.
+
+        Examples:
+            >>> executor.close()
+        """
+        self.pause_scheduler()
+        self._shutdown_pool()
+        self._close_shell()
+        self._stop_logging()
+
     # ==================================================================
     # Internal methods (documented for completeness but typically hidden)
     # ==================================================================
 
     def _scheduler_loop(self) -> None:
-        """Internal: Main scheduler loop monitoring task execution times."""
+        """Internal: Main scheduler loop sleeping until the nearest task deadline.
+
+        The wait has no periodic cap, so it must never be handed an always
+        due heap head: interval tasks are re-queued only after their run
+        completes and at least _MIN_REARM_NS later.
+        """
         self.logger.debug("Scheduler loop started")
         while not self.stop_scheduler.is_set():
             try:
-                current_time = time.time()
-                for task_id, task in list(self.scheduled_tasks.items()):
-                    if not task.get('active', False):
-                        continue
+                for task_id in self._pop_due_tasks():
+                    self._trigger_task(task_id)
+
+                with self._cv:
+                    if not self.stop_scheduler.is_set():
+                        self._cv.wait(self._next_wait_timeout())
+            except Exception as e:
+                self.logger.critical("Scheduler loop failed: %s", e, exc_info=True)
+                break
+
+    def _run_builtin(self, command: str, cwd: str) -> Optional[Tuple[str, str, int]]:
+        """Internal: Emulate a trivial shell built-in without starting a process.
+
+        Args:
+            command (str): Command line as passed to execute_command
+            cwd (str): Directory the command would run in
 
-                    if task['type'] == 'interval':
-                        if current_time - task['last_run'] >= task['interval']:
-                            self._trigger_task(task_id)
+        Returns:
+            Optional[Tuple[str, str, int]]: Result in execute_command format,
+                or None if the command has to be run by the real shell
+        """
+        if not _SHELL_SPECIAL.isdisjoint(command):
+            return None
+
+        name, _, args = command.lstrip().partition(' ')
+        if os.name == 'nt':
+            name = name.lower()
+        handler = self._builtin_handlers.get(name)
+        return handler(args, cwd) if handler else None
+
+    def _builtin_echo(self, args: str, cwd: str) -> Optional[Tuple[str, str, int]]:
+        """Internal: ``echo`` with plain words, as printed by sh or cmd.exe."""
+        words = args.split()
+        if not words:
+            return None  # cmd.exe reports echo state, sh prints a blank line
+        if os.name == 'nt':
+            if args.strip().lower() in ('on', 'off') or words[0].startswith('/'):
+                return None
+            return (args + '\n', '', 0)
+        if words[0].startswith('-'):
+            return None
+        return (' '.join(words) + '\n', '', 0)
+
+    def _builtin_cd(self, args: str, cwd: str) -> Optional[Tuple[str, str, int]]:
+        """Internal: ``cd <dir>`` into an existing directory (no output).
+
+        Failures fall back to the shell to keep its native error message.
+        """
+        words = args.split()
+        if len(words) != 1 or words[0].startswith(('-', '/')):
+            return None
+        if not os.path.isdir(os.path.join(cwd, words[0])):
+            return None
+        return ('', '', 0)
+
+    def _get_shell(self) -> _PersistentShell:
+        """Internal: Return persistent shell, restarting it if environment changed."""
+        with self._shell_lock:
+            if self._shell is None or self._shell.env is not self._env_cache:
+                if self._shell is not None:
+                    self._shell.close()
+                self._shell = _PersistentShell(self._env_cache)
+            return self._shell
+
+    def _close_shell(self) -> None:
+        """Internal: Stop persistent shell if one was started."""
+        shell_lock = getattr(self, '_shell_lock', None)
+        if shell_lock is None:
+            return
+        with shell_lock:
+            if self._shell is not None:
+                self._shell.close()
+                self._shell = None
+
+    def _decode_output(self, data: bytes) -> str:
+        """Internal: Decode raw output like subprocess text mode does."""
+        text = data.decode(self.encoding, errors='replace')
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+    def _rebuild_env(self) -> None:
+        """Internal: Recompute environment passed to executed commands.
+
+        The merged mapping is built once per change and handed to every
+        subprocess as is; the read-only proxy keeps the shared copy intact.
+        """
+        self._env_cache = MappingProxyType({**os.environ, **self.env_vars})
+
+    def _register_task(self, task: Dict[str, Any], run_at: Optional[int]) -> int:
+        """Internal: Allocate ID, store task and queue its first run.
+
+        Everything a producer needs happens in a single acquisition of the
+        scheduler lock, keeping contention between scheduling threads low.
+
+        Args:
+            task (Dict): Task structure
+            run_at (int, optional): First execution time in time.monotonic_ns()
+                units, None to leave queueing to the caller (e.g. immediate run)
+
+        Returns:
+            int: New task identifier
+        """
+        with self._cv:
+            self.task_id_counter += 1
+            task_id = self.task_id_counter
+            self.scheduled_tasks[task_id] = task
+            self._tasks_version += 1
+            if run_at is not None:
+                self._push_task_locked(task_id, run_at)
+        return task_id
+
+    def _push_task(self, task_id: int, run_at: int) -> None:
+        """Internal: Queue task for execution at given time.
+
+        Deadlines use the monotonic clock, so wall-clock adjustments (NTP
+        steps, manual changes) neither stall nor bunch up interval tasks.
+
+        Args:
+            task_id (int): ID of task to queue
+            run_at (int): Execution time in time.monotonic_ns() units
+        """
+        with self._cv:
+            self._push_task_locked(task_id, run_at)
+
+    def _push_task_locked(self, task_id: int, run_at: int) -> None:
+        """Internal: _push_task for callers already holding the scheduler lock."""
+        heapq.heappush(self._task_heap, (run_at, task_id))
+        if self._task_heap[0][1] == task_id:
+            self._cv.notify()
 
-                    elif task['type'] == 'at':
-                        if not task['fired'] and current_time >= task['execution_time']:
-                            self._trigger_task(task_id)
+    def _wake_scheduler(self) -> None:
+        """Internal: Interrupt scheduler wait, e.g. to let it notice a stop."""
+        with self._cv:
+            self._cv.notify_all()
 
-                time.sleep(1)
+    def _pop_due_tasks(self) -> List[int]:
+        """Internal: Take all tasks whose execution time has come off the heap.
+
+        Entries of removed, inactive or already fired tasks are dropped.
+
+        Returns:
+            List[int]: IDs of tasks to trigger, earliest first
+        """
+        now = time.monotonic_ns()
+        due = []
+        with self._lock:
+            while self._task_heap and self._task_heap[0][0] <= now:
+                _, task_id = heapq.heappop(self._task_heap)
+                task = self.scheduled_tasks.get(task_id)
+                if not task or not task.get('active', False):
+                    continue
+                if task['type'] == 'at' and task['fired']:
+                    continue
+                due.append(task_id)
+        return due
+
+    def _next_wait_timeout(self) -> Optional[float]:
+        """Internal: Compute scheduler sleep time until the nearest deadline.
+
+        Must be called with the scheduler lock held.
+
+        Returns:
+            Optional[float]: Seconds to wait, None to wait for a notification
+        """
+        if not self._task_heap:
+            return None
+        return max(self._task_heap[0][0] - time.monotonic_ns(), 0) / _NS_PER_SECOND
+
+    def _iter_output_lines(self, stream: IO[bytes]) -> Iterator[str]:
+        """Internal: Yield stripped output lines from a binary process pipe.
+
+        Each read returns whatever the pipe currently holds (up to 64 KiB),
+        which is then decoded and split in one pass instead of line by line.
+        Line endings follow universal newlines mode.
+
+        Args:
+            stream (IO[bytes]): Buffered binary stream, e.g. ``Popen.stdout``
+        """
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        carry = ''
+        while True:
+            chunk = stream.read1(65536)
+            final = not chunk
+            text = carry + decoder.decode(chunk, final)
+            carry = ''
+            if not final and text.endswith('\r'):
+                # "\r\n" may be split between two reads
+                text, carry = text[:-1], '\r'
+
+            lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+            carry = lines.pop() + carry
+            for line in lines:
+                yield line.strip()
+
+            if final:
+                if carry:
+                    yield carry.strip()
+                return
+
+    def _consume_output(self, stream: IO[bytes]) -> Iterator[str]:
+        """Internal: Yield output lines read from the pipe by a background thread.
+
+        The reader keeps draining the pipe while the consumer is busy, so a
+        slow output_callback does not fill the OS pipe buffer and stall the
+        child process. Reader errors are re-raised in the consumer.
+
+        Args:
+            stream (IO[bytes]): Buffered binary stream, e.g. ``Popen.stdout``
+        """
+        lines: queue.Queue = queue.Queue(maxsize=_OUTPUT_QUEUE_SIZE)
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        def reader() -> None:
+            try:
+                for line in self._iter_output_lines(stream):
+                    lines.put(line)
+                    if stop.is_set():
+                        break
             except Exception as e:
-                self.logger.critical(f"Scheduler loop failed: {str(e)}", exc_info=True)
-                break
+                errors.append(e)
+            finally:
+                lines.put(None)
+
+        threading.Thread(target=reader, name="OutputReader", daemon=True).start()
+        line: Optional[str] = ''
+        try:
+            while (line := lines.get()) is not None:
+                yield line
+            if errors:
+                raise errors[0]
+        finally:
+            if line is not None:
+                # Consumer stopped early: release a reader blocked on put()
+                stop.set()
+                while True:
+                    try:
+                        lines.get_nowait()
+                    except queue.Empty:
+                        break
 
     def _execute_scheduled_task(self, task_id: int) -> None:
         """Internal: Execute task and handle completion logic."""
         task = self.scheduled_tasks.get(task_id)
         if not task or 'run_count' not in task:
-            self.logger.error(f"Invalid task structure: {task_id}")
+            self.logger.error("Invalid task structure: %s", task_id)
             return
 
         try:
-            self.logger.info(f"Executing task {task_id}: {task['command']}")
+            self.logger.info("Executing task %s: %s", task_id, task['command'])
             stdout, stderr, code = self.execute_command(task['command'])
 
         except Exception as e:
-            self.logger.error(f"Task {task_id} failed: {str(e)}", exc_info=True)
+            self.logger.error("Task %s failed: %s", task_id, e, exc_info=True)
             stdout, stderr, code = "", str(e), -1
 
         finally:
+            removed = False
+            with self._cv:
+                task['running'] = False
+                task['last_run'] = time.time()
+                self._tasks_version += 1
+                if task['type'] == 'at' or (
+                    task['max_runs'] is not None
+                    and task['run_count'] >= task['max_runs']
+                ):
+                    removed = self.scheduled_tasks.pop(task_id, None) is not None
+                elif self.scheduled_tasks.get(task_id) is task:
+                    # Next run is armed only now, counted from the end of this one
+                    delay = max(int(task['interval'] * _NS_PER_SECOND), _MIN_REARM_NS)
+                    self._push_task_locked(task_id, time.monotonic_ns() + delay)
+            if removed:
+                self.logger.info("Removed task %s", task_id)
+
+            # Task state is final by the time the callback is notified
             if task.get('callback'):
-                task['callback'](stdout, stderr, code)
+                try:
+                    task['callback'](stdout, stderr, code)
+                except Exception as e:
+                    self.logger.error(
+                        "Callback for task %s failed: %s", task_id, e, exc_info=True
+                    )
 
-            task['run_count'] += 1
-            task['last_run'] = time.time()
-
-            if task['type'] == 'at' or (task['max_runs']
-                                        is not None and task['run_count'] >= task['max_runs']):
-                self.remove_scheduled_task(task_id)
+            self._log_mem_handler.flush()
 
     def _trigger_task(self, task_id: int) -> None:
-        """Internal: Launch task execution in separate thread.
+        """Internal: Submit task execution to the worker thread pool.
+
+        The run is counted here, at dispatch. A task whose previous run is
+        still in flight is skipped; interval tasks are re-queued by
+        _execute_scheduled_task once their run completes.
 
         Args:
             task_id (int): ID of task to trigger
         """
         try:
-            task = self.scheduled_tasks[task_id]
-            task['last_run'] = time.time()
-
-            thread = threading.Thread(
-                target=self._execute_scheduled_task,
-                args=(task_id,),
-                name=f"TaskExecutor-{task_id}"
-            )
-            thread.start()
+            with self._cv:
+                task = self.scheduled_tasks[task_id]
+                if task.get('running'):
+                    self.logger.debug("Task %s still running, trigger skipped", task_id)
+                    return
+                task['running'] = True
+                task['run_count'] += 1
+                task['last_run'] = time.time()
+                if task['type'] == 'at':
+                    task['fired'] = True
+                self._tasks_version += 1
+
+            future = self._task_pool.submit(self._execute_scheduled_task, task_id)
+            self._task_futures.add(future)
+            future.add_done_callback(self._task_futures.discard)
 
             if task['type'] == 'at':
-                task['fired'] = True
-                self.logger.info(f"Triggered one-time task {task_id}")
+                self.logger.info("Triggered one-time task %s", task_id)
             else:
-                self.logger.debug(f"Triggered interval task {task_id}")
+                self.logger.debug("Triggered interval task %s", task_id)
 
         except KeyError:
-            self.logger.error(f"Failed to trigger missing task {task_id}")
+            self.logger.error("Failed to trigger missing task %s", task_id)
         except Exception as e:
-            self.logger.error(f"Task trigger failed: {str(e)}", exc_info=True)
+            self.logger.error("Task trigger failed: %s", e, exc_info=True)
 
     def _start_scheduler(self) -> None:
         """Internal: Initialize and start scheduler background thread."""
@@ -581,11 +1084,46 @@ class CommandExecutor:
         if self.scheduler_thread and self.scheduler_thread.is_alive():
             self.stop_scheduler.set()
             try:
+                self._wake_scheduler()
                 if self.scheduler_thread is not threading.current_thread():
                     self.scheduler_thread.join(timeout=0.5)
             except RuntimeError:
                 pass
             self.logger.info("Scheduler thread stopped")
+        self._shutdown_pool()
+        try:
+            self._close_shell()
+            self._stop_logging()
+        except RuntimeError:
+            pass
+
+    def _shutdown_pool(self) -> None:
+        """Internal: Stop task pool, cancelling runs that have not started.
+
+        Runs already in progress finish on their own. Queued futures are
+        tracked and cancelled explicitly, since shutdown(cancel_futures=True)
+        needs Python 3.9.
+        """
+        pool = getattr(self, '_task_pool', None)
+        if pool is None:
+            return
+        for future in list(getattr(self, '_task_futures', ())):
+            future.cancel()
+        pool.shutdown(wait=False)
+
+    def _stop_logging(self) -> None:
+        """Internal: Detach queue handler and drain pending log records."""
+        listener = getattr(self, '_log_listener', None)
+        if listener is None:
+            return
+
+        self._log_listener = None
+        self.logger.removeHandler(self._log_handler)
+        listener.stop()
+        file_handler = self._log_mem_handler.target
+        for handler in listener.handlers:
+            handler.close()
+        file_handler.close()
 
     def _handle_task_removal(self, task_id: int) -> None:
         """Internal: Helping for task cleanup operations.
@@ -593,9 +1131,13 @@ class CommandExecutor:
         Args:
             task_id (int): ID of task to clean up
         """
-        if task_id in self.scheduled_tasks:
-            del self.scheduled_tasks[task_id]
-            self.logger.debug(f"Internal cleanup for task {task_id}")
+        with self._lock:
+            removed = self.scheduled_tasks.pop(task_id, None) is not None
+            if removed:
+                self._tasks_version += 1
+
+        if removed:
+            self.logger.debug("Internal cleanup for task %s", task_id)
 
     def _validate_task_structure(self, task: Dict) -> bool:
         """Internal: Validate task dictionary integrity.
@@ -603,8 +1145,4 @@ class CommandExecutor:
         Returns:
             bool: True if task structure is valid
         """
-        required_keys = {
-            'type', 'command', 'active',
-            'last_run', 'max_runs', 'run_count'
-        }
-        return all(key in task for key in required_keys)
+        return _REQUIRED_TASK_KEYS <= task.keys()
@@ -1,37 +1,579 @@
 """File system operations handler for pyAdmin package."""
 
+import errno
+import functools
+import logging
+import mmap
+import os
 import shutil
+import struct
+import sys
+import tempfile
+import time
 import zipfile
-import inspect
-from typing import Dict, List, Optional
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
+
+try:
+    # Drop-in zlib replacement with SIMD-accelerated deflate and CRC32
+    from zlib_ng import zlib_ng as _zlib
+except ImportError:
+    import zlib as _zlib
+
+try:
+    # libdeflate bindings: faster whole-buffer deflate than zlib's streaming API
+    import deflate as _libdeflate
+except ImportError:
+    _libdeflate = None
+
+if sys.platform == 'win32':
+    import ctypes
+
+_CHUNK_SIZE = 1024 * 1024
+_ZIP64_LIMIT = 0xFFFFFFFF
+# Precompiled ZIP record layouts (APPNOTE 4.3.7, 4.3.12, 4.3.14-16, 4.5.3)
+_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+_CENTRAL_HEADER = struct.Struct('<4s4B4HL2L5H2L')
+_ZIP64_LOCAL_EXTRA = struct.Struct('<HHQQ')
+_ZIP64_END = struct.Struct('<4sQ2H2L4Q')
+_ZIP64_LOCATOR = struct.Struct('<4sLQL')
+_END_RECORD = struct.Struct('<4s4H2LH')
+# Output buffer for archives: coalesces the small header/record writes
+_WRITE_BUFFER_SIZE = 256 * 1024
+_DEFLATE_LEVEL = 6
+# Files above this size are deflated chunk by chunk into a spooled temporary
+# file instead of in one call, so big inputs never sit in memory whole
+_SPOOL_THRESHOLD = 4 * 1024 * 1024
+# Bound for compressed data held in memory between the workers and the writer
+_MAX_PENDING_BYTES = 64 * 1024 * 1024
+# Concurrent file operations in copy_files/move_files; I/O bound, not CPU bound
+_BATCH_WORKERS = 16
+_DATE_FORMAT = "%02d.%02d.%04d"
+# On Windows DirEntry.stat() is served from the FindNextFile data of the
+# directory listing, so one scandir replaces a stat call per file
+_SCANDIR_STAT = os.name == 'nt'
+# copy_file_range/sendfile errors meaning "not supported here",
+# e.g. across filesystems or for file targets on BSD/macOS
+_KERNEL_COPY_UNSUPPORTED = frozenset(
+    getattr(errno, name)
+    for name in ('EXDEV', 'EINVAL', 'ENOSYS', 'EOPNOTSUPP', 'ENOTSUP', 'ENOTSOCK')
+    if hasattr(errno, name)
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_cached(base: Path, path: str) -> Path:
+    """Resolve path against base directory, memoized per (base, path)."""
+    return (base / path).resolve()
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy file contents inside the kernel where the platform allows it.
+
+    Uses CopyFileW on Windows. Elsewhere tries os.copy_file_range, then
+    os.sendfile, and falls back to a plain read/write loop if the
+    filesystem refuses both before any data was transferred.
+
+    Args:
+        src: Absolute path to source file
+        dst: Absolute path to destination file (overwritten)
+
+    Raises:
+        IsADirectoryError: If the source is a directory
+        shutil.SpecialFileError: If the source is not a regular file
+        OSError: If the source cannot be read or destination written
+    """
+    if sys.platform == 'win32':
+        if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError()
+        return
+
+    # O_NONBLOCK keeps the open from hanging on a FIFO without a writer
+    src_fd = os.open(src, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        src_stat = os.fstat(src_fd)
+        # Checked before the destination is opened (and truncated)
+        if S_ISDIR(src_stat.st_mode):
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), str(src))
+        if not S_ISREG(src_stat.st_mode):
+            raise shutil.SpecialFileError(f"{src!s} is not a regular file")
+        try:
+            dst_stat = os.stat(dst)
+        except FileNotFoundError:
+            pass
+        else:
+            if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+                raise shutil.SameFileError(f"{src!s} and {dst!s} are the same file")
+
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            _copy_fd(src_fd, dst_fd, src_stat.st_size)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _copy_fd(src_fd: int, dst_fd: int, size: int) -> int:
+    """Copy file between descriptors, preferring in-kernel transfer.
+
+    The source descriptor must be positioned at the start of the file and
+    the destination at the place to write to.
+
+    Args:
+        src_fd: Source descriptor
+        dst_fd: Destination descriptor
+        size: Bytes to copy; 0 copies until end of file (for files that
+            report no size, e.g. in /proc)
+
+    Returns:
+        int: Bytes actually copied, less than size if the file shrank
+    """
+    if size:
+        if hasattr(os, 'copy_file_range'):
+            copied = _kernel_copy(
+                lambda count, offset: os.copy_file_range(src_fd, dst_fd, count), size
+            )
+            if copied is not None:
+                return copied
+        # sendfile takes an explicit offset and leaves the source position at 0
+        if hasattr(os, 'sendfile'):
+            copied = _kernel_copy(
+                lambda count, offset: os.sendfile(dst_fd, src_fd, offset, count), size
+            )
+            if copied is not None:
+                return copied
+
+    copied = 0
+    while not size or copied < size:
+        data = os.read(src_fd, min(_CHUNK_SIZE, size - copied) if size else _CHUNK_SIZE)
+        if not data:
+            break
+        copied += len(data)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(dst_fd, view):]
+    return copied
+
+
+def _kernel_copy(transfer: Callable[[int, int], int], size: int) -> Optional[int]:
+    """Run in-kernel copy calls until size bytes are transferred.
+
+    Args:
+        transfer: Function (count, offset) -> bytes copied
+        size: Total bytes to copy
+
+    Returns:
+        Optional[int]: Bytes copied, None if the method is unsupported and
+            nothing was copied
+    """
+    copied = 0
+    while copied < size:
+        try:
+            sent = transfer(min(size - copied, 1 << 30), copied)
+        except OSError as e:
+            if copied or e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+            return None
+        if not sent:
+            return copied or None
+        copied += sent
+    return copied
+
+
+def _format_date(timestamp: float) -> str:
+    """Format timestamp as local DD.MM.YYYY date without strftime."""
+    tm = time.localtime(timestamp)
+    return _DATE_FORMAT % (tm.tm_mday, tm.tm_mon, tm.tm_year)
+
+
+def _zlib_compressor(level: int, size: int):
+    """Create raw DEFLATE compressor with the smallest window that fits size.
+
+    Most of compressobj's setup cost is allocating and clearing the window
+    and hash tables (about 256 KiB at the default 32 KiB window). A window
+    larger than the input can never be used, so small files get a smaller
+    one; the stream stays decodable by any inflater.
+    """
+    wbits = min(max(size.bit_length(), 9), 15)
+    return _zlib.compressobj(level, _zlib.DEFLATED, -wbits)
+
+
+def _deflate_file(
+    path: Path,
+    level: int = _DEFLATE_LEVEL,
+    size: Optional[int] = None
+) -> Tuple[int, int, int, Iterable[bytes]]:
+    """Compress file to a raw DEFLATE stream.
+
+    Files up to _SPOOL_THRESHOLD are memory-mapped and handed to libdeflate
+    (if installed) or zlib in a single call, without copying them into
+    Python buffers. Both release the GIL while compressing, so several
+    files can be processed by threads at once. Larger files are read in
+    chunks and their output is spooled to a temporary file, keeping memory
+    use independent of file size. Empty files and files that cannot be
+    mapped are read in chunks as well.
+
+    Args:
+        path: Absolute path to source file
+        level: Compression level, 0 (store) to 9 (best)
+        size: File size if already known from a stat call
+
+    Returns:
+        Tuple: CRC32 and size of the source data, compressed size and
+            compressed chunks
+    """
+    with open(path, 'rb') as src:
+        if size is None:
+            size = os.fstat(src.fileno()).st_size
+        if size > _SPOOL_THRESHOLD:
+            return _deflate_spooled(src, level, size)
+        if size:
+            try:
+                data = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass  # e.g. filesystems without mmap support
+            else:
+                with data:
+                    if _libdeflate is not None:
+                        crc = _libdeflate.crc32(data)
+                        chunks = [_libdeflate.deflate_compress(data, level)]
+                    else:
+                        compressor = _zlib_compressor(level, size)
+                        crc = _zlib.crc32(data)
+                        chunks = [compressor.compress(data), compressor.flush()]
+                    return crc, len(data), sum(map(len, chunks)), chunks
+        chunks = []
+        crc, size = _deflate_stream(src, level, size, chunks.append)
+        return crc, size, sum(map(len, chunks)), chunks
+
+
+def _deflate_spooled(
+    src: BinaryIO,
+    level: int,
+    size_hint: int
+) -> Tuple[int, int, int, Iterator[bytes]]:
+    """Compress open file into a spooled temporary file.
+
+    Output stays in memory while it fits _SPOOL_THRESHOLD (typical for
+    text and logs) and is moved to disk beyond that.
+
+    Returns:
+        Tuple: Same as _deflate_file; the chunks iterator reads the spooled
+            data back and removes the temporary file when exhausted
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_THRESHOLD)
+    try:
+        crc, size = _deflate_stream(src, level, size_hint, spool.write)
+        compress_size = spool.tell()
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+    return crc, size, compress_size, _read_spool(spool)
+
+
+def _read_spool(spool: BinaryIO) -> Iterator[bytes]:
+    """Yield spooled data in _CHUNK_SIZE blocks, closing the spool afterwards."""
+    with spool:
+        while chunk := spool.read(_CHUNK_SIZE):
+            yield chunk
+
+
+def _deflate_stream(
+    src: BinaryIO,
+    level: int,
+    size_hint: int,
+    emit: Callable[[bytes], None]
+) -> Tuple[int, int]:
+    """Compress open file with zlib, reading it in _CHUNK_SIZE blocks.
+
+    size_hint only selects the window size; a file that grew since it was
+    stat'ed is still compressed completely.
+
+    Args:
+        src: Source file opened for binary reading
+        level: Compression level
+        size_hint: Expected file size
+        emit: Receives every piece of compressed output in order
+
+    Returns:
+        Tuple: CRC32 and size of the source data
+    """
+    compressor = _zlib_compressor(level, size_hint)
+    crc = 0
+    size = 0
+    while True:
+        data = src.read(_CHUNK_SIZE)
+        if not data:
+            break
+        crc = _zlib.crc32(data, crc)
+        size += len(data)
+        emit(compressor.compress(data))
+    emit(compressor.flush())
+    return crc, size
+
+
+def _zipinfo_from_stat(arcname: str, st: os.stat_result) -> zipfile.ZipInfo:
+    """Build member metadata like ZipInfo.from_file, from an existing stat result."""
+    zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    return zinfo
+
+
+def _crc_file(path: Path, size: int) -> int:
+    """Compute CRC32 of file, over a memory map where possible."""
+    if not size:
+        return 0
+    with open(path, 'rb') as src:
+        try:
+            data = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            crc = 0
+            while True:
+                chunk = src.read(_CHUNK_SIZE)
+                if not chunk:
+                    return crc
+                crc = _zlib.crc32(chunk, crc)
+        with data:
+            return (_libdeflate or _zlib).crc32(data)
+
+
+def _deflate_member(
+    path: Path,
+    st: os.stat_result,
+    level: int
+) -> Tuple[zipfile.ZipInfo, Optional[Iterable[bytes]]]:
+    """Compress file into a ready-to-write archive member.
+
+    Level 0 members are stored: only the CRC is computed here and the data
+    is later copied by _ZipWriter.write_file straight from the source file.
+
+    Args:
+        path: Absolute path to source file
+        st: Stat result for path, taken when the file was validated
+        level: Compression level passed to _deflate_file
+
+    Returns:
+        Tuple: Member metadata with CRC and sizes filled in, compressed
+            chunks (None for stored members)
+    """
+    zinfo = _zipinfo_from_stat(path.name, st)
+    if level == 0:
+        zinfo.compress_type = zipfile.ZIP_STORED
+        zinfo.CRC = _crc_file(path, st.st_size)
+        zinfo.compress_size = st.st_size
+        return zinfo, None
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC, zinfo.file_size, zinfo.compress_size, chunks = _deflate_file(
+        path, level, st.st_size
+    )
+    return zinfo, chunks
+
+
+def _deflate_files(
+    sources: List[Tuple[Path, os.stat_result]],
+    level: int = _DEFLATE_LEVEL
+) -> Iterator[Tuple[zipfile.ZipInfo, Optional[Iterable[bytes]]]]:
+    """Compress files in a thread pool, yielding members in input order.
+
+    Workers handle metadata and compression; the caller only writes records.
+    At most two results per worker, and about _MAX_PENDING_BYTES of
+    compressed data held in memory, are kept ahead of the consumer.
+
+    Args:
+        sources: Absolute paths to source files with their stat results
+        level: Compression level for every member
+
+    Yields:
+        Tuple: Result of _deflate_member for each path
+    """
+    workers = min(len(sources), os.cpu_count() or 1) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        pending_bytes = 0
+        for path, st in sources:
+            # In-memory output is at most about the input size, spooled
+            # members keep up to _SPOOL_THRESHOLD; stored members keep none
+            cost = min(st.st_size, _SPOOL_THRESHOLD) if level else 0
+            pending.append((pool.submit(_deflate_member, path, st, level), cost))
+            pending_bytes += cost
+            while len(pending) > 2 * workers or pending_bytes > _MAX_PENDING_BYTES:
+                future, cost = pending.popleft()
+                pending_bytes -= cost
+                yield future.result()
+        while pending:
+            yield pending.popleft()[0].result()
+
+
+class _ZipWriter:
+    """Write ZIP archive from members compressed ahead of time.
+
+    zipfile.ZipFile compresses every member itself while writing it, so it
+    cannot store data deflated elsewhere, e.g. by worker threads. This
+    writer only lays out local headers, payloads and the central directory
+    (with ZIP64 records where sizes or offsets require them).
+    """
+
+    def __init__(self, fp: BinaryIO) -> None:
+        self._fp = fp
+        self._offset = 0
+        self._central_dir = []
+
+    def write(self, zinfo: zipfile.ZipInfo, chunks: Iterable[bytes]) -> None:
+        """Append member with CRC, file_size and compress_size already set.
+
+        Args:
+            zinfo: Member metadata
+            chunks: Payload in the member's compression format
+        """
+        def write_chunks() -> None:
+            for chunk in chunks:
+                self._emit(chunk)
+
+        self._write_member(zinfo, write_chunks)
+
+    def write_file(self, zinfo: zipfile.ZipInfo, path: Path) -> None:
+        """Append stored member, copying its data from path in the kernel.
+
+        Requires a real file as output; buffered data is flushed first.
+
+        Args:
+            zinfo: Member metadata with CRC and file_size set
+            path: Source file, expected to be exactly zinfo.file_size long
+
+        Raises:
+            OSError: If the source size changed since it was checked
+        """
+        def copy_file() -> None:
+            if not zinfo.file_size:
+                return
+            self._fp.flush()
+            with open(path, 'rb') as src:
+                copied = _copy_fd(src.fileno(), self._fp.fileno(), zinfo.file_size)
+            self._offset += copied
+            if copied != zinfo.file_size:
+                raise OSError(f"{path} changed while being archived")
+
+        self._write_member(zinfo, copy_file)
+
+    def _write_member(self, zinfo: zipfile.ZipInfo, write_payload: Callable[[], None]) -> None:
+        """Internal: Emit local header, payload and central directory entry."""
+        try:
+            name = zinfo.filename.encode('ascii')
+            flags = 0
+        except UnicodeEncodeError:
+            name = zinfo.filename.encode('utf-8')
+            flags = 0x800
+
+        year, month, day, hour, minute, second = zinfo.date_time
+        dosdate = (year - 1980) << 9 | month << 5 | day
+        dostime = hour << 11 | minute << 5 | second // 2
+
+        file_size = zinfo.file_size
+        compress_size = zinfo.compress_size
+        header_offset = self._offset
+        zinfo.header_offset = header_offset
+
+        local_extra = b''
+        if file_size >= _ZIP64_LIMIT or compress_size >= _ZIP64_LIMIT:
+            local_extra = _ZIP64_LOCAL_EXTRA.pack(1, 16, file_size, compress_size)
+        local_version = 45 if local_extra else 20
+        self._emit(_LOCAL_HEADER.pack(
+            b'PK\x03\x04', local_version, 0, flags,
+            zinfo.compress_type, dostime, dosdate, zinfo.CRC,
+            _ZIP64_LIMIT if local_extra else compress_size,
+            _ZIP64_LIMIT if local_extra else file_size,
+            len(name), len(local_extra)
+        ))
+        self._emit(name)
+        self._emit(local_extra)
+        write_payload()
+
+        zip64_fields = [
+            value for value in (file_size, compress_size, header_offset)
+            if value >= _ZIP64_LIMIT
+        ]
+        extra = b''
+        if zip64_fields:
+            extra = struct.pack(
+                f'<HH{len(zip64_fields)}Q', 1, 8 * len(zip64_fields), *zip64_fields
+            )
+        version = 45 if zip64_fields else 20
+        self._central_dir.append(_CENTRAL_HEADER.pack(
+            b'PK\x01\x02', version, zinfo.create_system,
+            version, 0, flags, zinfo.compress_type, dostime, dosdate, zinfo.CRC,
+            min(compress_size, _ZIP64_LIMIT), min(file_size, _ZIP64_LIMIT),
+            len(name), len(extra), 0, 0, 0, zinfo.external_attr,
+            min(header_offset, _ZIP64_LIMIT)
+        ) + name + extra)
+
+    def close(self) -> None:
+        """Write central directory and end of archive records."""
+        cd_offset = self._offset
+        self._emit(b''.join(self._central_dir))
+        cd_size = self._offset - cd_offset
+        count = len(self._central_dir)
+
+        if count >= 0xFFFF or cd_size >= _ZIP64_LIMIT or cd_offset >= _ZIP64_LIMIT:
+            end64_offset = self._offset
+            self._emit(_ZIP64_END.pack(
+                b'PK\x06\x06', 44, 45, 45, 0, 0,
+                count, count, cd_size, cd_offset
+            ))
+            self._emit(_ZIP64_LOCATOR.pack(b'PK\x06\x07', 0, end64_offset, 1))
+            count = min(count, 0xFFFF)
+            cd_size = min(cd_size, _ZIP64_LIMIT)
+            cd_offset = min(cd_offset, _ZIP64_LIMIT)
+
+        self._emit(_END_RECORD.pack(
+            b'PK\x05\x06', 0, 0, count, count, cd_size, cd_offset, 0
+        ))
+
+    def _emit(self, data: bytes) -> None:
+        self._fp.write(data)
+        self._offset += len(data)
 
 
 class FileManager:
     """Manage file system operations with path resolution and error handling.
 
     Provides methods for:
-    - Copying/moving files with automatic directory creation
+    - Copying/moving files with automatic directory creation, singly or in batches
     - Creating ZIP archives
     - Retrieving file metadata
     - Path resolution relative to caller's directory
 
     Attributes:
         caller_dir (Path): The directory of the script that instantiated the FileManager.
+        logger (logging.Logger): Logger for operation status and errors.
     """
 
     def __init__(self) -> None:
         """Initialize FileManager with caller's directory as base path.
 
         Determines the directory of the caller script (where the FileManager is instantiated)
-        and sets it as the base path for relative operations.
+        and sets it as the base path for relative operations. Falls back to the
+        current working directory when the caller has no source file
+        (e.g. interactive session).
 
         Example:
             >>> fm = FileManager()
         """
-        frame = inspect.stack()[1]
-        self.caller_dir = Path(frame.filename).parent.resolve()
+        try:
+            caller_file = sys._getframe(1).f_code.co_filename
+        except ValueError:  # no calling frame
+            caller_file = ''
+        # Code without a source file reports pseudo-names like "<stdin>"
+        if caller_file and not caller_file.startswith('<'):
+            self.caller_dir = Path(caller_file).parent.resolve()
+        else:
+            self.caller_dir = Path.cwd()
+        self.logger = logging.getLogger("pyAdmin.FileManager")
 
     def _resolve_path(self, path: str) -> Path:
         """Convert relative path to absolute path relative to caller's directory.
@@ -39,6 +581,8 @@ class FileManager:
         Args:
             path: Relative path string to resolve
 
+        Results are cached; see clear_path_cache.
+
         Returns:
             Path: Absolute Path object resolved relative to caller's directory
 
@@ -46,51 +590,72 @@ class FileManager:
             >>> fm._resolve_path("data.txt")
             PosixPath('/home/user/project/data.txt')
         """
-        return (self.caller_dir / path).resolve()
+        return _resolve_cached(self.caller_dir, path)
+
+    def clear_path_cache(self) -> None:
+        """Drop cached path resolutions.
+
+        Needed only when symlinks or directories along already used paths
+        are changed outside of FileManager.
+
+        Example:
+            >>> fm.clear_path_cache()
+        """
+        _resolve_cached.cache_clear()
 
     def copy_file(self, source: str, destination: str) -> bool:
         """Copy file with full path resolution and error handling.
 
         Automatically creates destination directories if needed.
-        Prints operation status and errors.
+        Logs operation status and errors. Contents are copied in the kernel
+        where the platform supports it (copy_file_range or sendfile on Linux,
+        CopyFileW on Windows); permission bits and timestamps are then
+        copied like shutil.copy2 does.
 
         Args:
             source: Relative path to source file
-            destination: Relative destination path
+            destination: Relative destination path; an existing directory
+                receives the file under its original name
 
         Returns:
             bool: True if copy succeeded, False otherwise
 
         Example:
             >>> fm.copy_file("config.yml", "backups/config_backup.yml")
-            File /project/config.yml copied to /project/backups/config_backup.yml
             True
 
-            >>> fm.copy_file("missing.txt", "backup.txt")
-            Copy failed: /project/missing.txt not found
+            >>> fm.copy_file("config.yml", "backups")  # -> backups/config.yml
+            True
+
+            >>> fm.copy_file("missing.txt", "backup.txt")  # logs "Copy failed: ... not found"
             False
         """
-        src = self._resolve_path(source)
-        dest = self._resolve_path(destination)
+        return self._copy_resolved(self._resolve_path(source), self._resolve_path(destination))
 
+    def _copy_resolved(self, src: Path, dest: Path, make_dirs: bool = True) -> bool:
+        """Internal: copy_file for already resolved paths."""
         try:
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(src, dest)
-            print(f"File {src.name} copied to {dest}")
+            if dest.is_dir():
+                dest = dest / src.name
+            if make_dirs:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+            _fast_copy(src, dest)
+            shutil.copystat(src, dest)
+            self.logger.info("File %s copied to %s", src.name, dest)
             return True
         except FileNotFoundError as e:
-            print(f"Copy failed: {e.filename} not found")
+            self.logger.error("Copy failed: %s not found", e.filename)
         except PermissionError as e:
-            print(f"Copy failed: Permission denied for {e.filename}")
+            self.logger.error("Copy failed: Permission denied for %s", e.filename)
         except Exception as e:
-            print(f"Copy error: {str(e)}")
+            self.logger.error("Copy error: %s", e)
         return False
 
     def move_file(self, source: str, destination: str) -> bool:
         """Move file with automatic directory creation.
 
         Automatically creates destination directories if needed.
-        Prints operation status and errors.
+        Logs operation status and errors.
 
         Args:
             source: Relative path to source file
@@ -101,68 +666,171 @@ class FileManager:
 
         Example:
             >>> fm.move_file("temp.log", "logs/2023.log")
-            File temp.log moved to logs/2023.log
             True
 
-            >>> fm.move_file("locked.file", "new.file")
-            Move failed: Permission denied for /project/locked.file
+            >>> fm.move_file("locked.file", "new.file")  # logs "Move failed: ..."
             False
         """
-        src = self._resolve_path(source)
-        dest = self._resolve_path(destination)
+        return self._move_resolved(self._resolve_path(source), self._resolve_path(destination))
 
+    def _move_resolved(self, src: Path, dest: Path, make_dirs: bool = True) -> bool:
+        """Internal: move_file for already resolved paths."""
         try:
-            dest.parent.mkdir(parents=True, exist_ok=True)
+            if make_dirs:
+                dest.parent.mkdir(parents=True, exist_ok=True)
             shutil.move(src, dest)
-            print(f"File {src.name} moved to {dest}")
+            self.logger.info("File %s moved to %s", src.name, dest)
             return True
         except FileNotFoundError as e:
-            print(f"Move failed: {e.filename} not found")
+            self.logger.error("Move failed: %s not found", e.filename)
         except PermissionError as e:
-            print(f"Move failed: Permission denied for {e.filename}")
+            self.logger.error("Move failed: Permission denied for %s", e.filename)
         except Exception as e:
-            print(f"Move error: {str(e)}")
+            self.logger.error("Move error: %s", e)
         return False
 
-    def compress_files(self, files: List[str], zip_name: str) -> bool:
+    def copy_files(self, pairs: Iterable[Tuple[str, str]]) -> List[bool]:
+        """Copy many files at once.
+
+        Each destination directory is created once per batch and the copies
+        run concurrently in a thread pool. Per-file behaviour and logging
+        match copy_file.
+
+        Args:
+            pairs: (source, destination) relative path pairs
+
+        Returns:
+            List[bool]: Result of each copy, in input order
+
+        Example:
+            >>> fm.copy_files([("a.txt", "backup/a.txt"), ("b.txt", "backup/b.txt")])
+            [True, True]
+        """
+        return self._run_batch(self._copy_resolved, pairs, "Copied")
+
+    def move_files(self, pairs: Iterable[Tuple[str, str]]) -> List[bool]:
+        """Move many files at once.
+
+        Like copy_files, but with move_file semantics for every pair.
+
+        Args:
+            pairs: (source, destination) relative path pairs
+
+        Returns:
+            List[bool]: Result of each move, in input order
+
+        Example:
+            >>> fm.move_files([("1.log", "logs/1.log"), ("2.log", "logs/2.log")])
+            [True, True]
+        """
+        return self._run_batch(self._move_resolved, pairs, "Moved")
+
+    def _run_batch(
+        self,
+        operation: Callable[[Path, Path, bool], bool],
+        pairs: Iterable[Tuple[str, str]],
+        verb: str
+    ) -> List[bool]:
+        """Internal: Apply single-file operation to many resolved pairs in parallel."""
+        resolved = [
+            (self._resolve_path(source), self._resolve_path(destination))
+            for source, destination in pairs
+        ]
+        if not resolved:
+            return []
+
+        for parent in {dest.parent for _, dest in resolved}:
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                # Affected pairs fail and are logged by the operation itself
+                self.logger.error("Cannot create directory %s: %s", parent, e)
+
+        workers = min(len(resolved), _BATCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda pair: operation(*pair, False), resolved))
+        self.logger.info("%s %d of %d files", verb, sum(results), len(results))
+        return results
+
+    def compress_files(
+        self,
+        files: List[str],
+        zip_name: str,
+        level: int = _DEFLATE_LEVEL
+    ) -> bool:
         """Create ZIP archive with validation of source files.
 
-        Skips non-file entries and directories. Prints detailed operation status.
+        Skips non-file entries and directories, logging them in a single
+        summary line.
+        Files are compressed in parallel worker threads (one per CPU core)
+        and written to the archive in the given order. Output of large files
+        is spooled through temporary files, so memory use does not grow with
+        file size.
 
         Args:
             files: List of relative file paths to compress
             zip_name: Name for output ZIP archive (relative path)
+            level: Deflate level from 1 (fastest) to 9 (best). Default: 6;
+                1 is several times faster on compressible data. 0 stores
+                files uncompressed, with data copied in the kernel
+                (copy_file_range/sendfile) instead of through Python
 
         Returns:
             bool: True if archive created successfully, False otherwise
 
+        Raises:
+            ValueError: If level is outside 0-9
+
         Example:
             >>> fm.compress_files(["data.csv", "config.yml"], "backup.zip")
-            Archive backup.zip created with 2 files
             True
 
-            >>> fm.compress_files(["missing.txt"], "empty.zip")
-            Skipping /project/missing.txt: Not a file
-            Archive empty.zip created with 0 files
+            >>> fm.compress_files(["huge.log"], "fast.zip", level=1)
+            True
+
+            >>> fm.compress_files(["missing.txt"], "empty.zip")  # logs skipped entries
             False
         """
+        if not 0 <= level <= 9:
+            raise ValueError(f"Compression level must be 0-9, got {level}")
         zip_path = self._resolve_path(zip_name)
         added_files = 0
 
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for file in files:
-                    file_path = self._resolve_path(file)
-                    if file_path.is_file():
-                        zipf.write(file_path, arcname=file_path.name)
-                        added_files += 1
+            sources = []
+            skipped = []
+            for file in files:
+                file_path = self._resolve_path(file)
+                # The only stat per file; reused for the member header
+                try:
+                    st = os.stat(file_path)
+                except (FileNotFoundError, NotADirectoryError):
+                    st = None
+                if st is not None and S_ISREG(st.st_mode):
+                    sources.append((file_path, st))
+                else:
+                    skipped.append(str(file_path))
+            if skipped:
+                self.logger.warning(
+                    "Skipping %d entries that are not files: %s",
+                    len(skipped), ", ".join(skipped)
+                )
+
+            with open(zip_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as fp:
+                writer = _ZipWriter(fp)
+                members = _deflate_files(sources, level)
+                for (file_path, _), (zinfo, chunks) in zip(sources, members):
+                    if chunks is None:
+                        writer.write_file(zinfo, file_path)
                     else:
-                        print(f"Skipping {file_path}: Not a file")
+                        writer.write(zinfo, chunks)
+                    added_files += 1
+                writer.close()
 
-            print(f"Archive {zip_path.name} created with {added_files} files")
+            self.logger.info("Archive %s created with %d files", zip_path.name, added_files)
             return added_files > 0
         except Exception as e:
-            print(f"Compression failed: {str(e)}")
+            self.logger.error("Compression failed: %s", e)
             return False
 
     def get_file_metadata(self, file_path: str) -> Dict[str, Optional[str]]:
@@ -190,26 +858,124 @@ class FileManager:
                 ...
             }
 
-            >>> fm.get_file_metadata("missing.file")
-            File missing.file not found
+            >>> fm.get_file_metadata("missing.file")  # logs "File missing.file not found"
             {}
         """
-        resolved_path = self._resolve_path(file_path)
+        return self._stat_metadata(self._resolve_path(file_path))
 
-        if not resolved_path.exists():
-            print(f"File {resolved_path.name} not found")
-            return {}
+    def get_file_metadata_batch(
+        self,
+        file_paths: List[str],
+        parallel: bool = False
+    ) -> Dict[str, Dict[str, Optional[str]]]:
+        """Retrieve metadata for several files at once.
+
+        Args:
+            file_paths: Relative paths to target files
+            parallel: Issue stat calls from a thread pool. Pays off on
+                network filesystems and cold caches where each stat waits
+                on I/O; for local cached trees the sequential path is faster
+
+        Returns:
+            Dict: Mapping of each requested path to its metadata dictionary
+                (see get_file_metadata); missing files map to empty dict
+
+        Example:
+            >>> fm.get_file_metadata_batch(["readme.md", "setup.py"])
+            {'readme.md': {'size_bytes': 2048, ...}, 'setup.py': {...}}
+        """
+        if not parallel or len(file_paths) < 2:
+            if _SCANDIR_STAT and len(file_paths) > 1:
+                return self._scandir_metadata(file_paths)
+            return {path: self._stat_metadata(self._resolve_path(path)) for path in file_paths}
+
+        resolved = [self._resolve_path(path) for path in file_paths]
+        with ThreadPoolExecutor(max_workers=min(len(resolved), _BATCH_WORKERS)) as pool:
+            return dict(zip(file_paths, pool.map(self._stat_metadata, resolved)))
+
+    def _stat_metadata(self, resolved_path: Path) -> Dict[str, Optional[str]]:
+        """Build metadata dictionary from a single stat call.
+
+        Args:
+            resolved_path: Absolute path to target file
 
+        Returns:
+            Dict: Metadata dictionary, empty if file not found or unreadable
+        """
         try:
-            stat = resolved_path.stat()
-            return {
-                'size_bytes': stat.st_size,
-                'creation_time': datetime.fromtimestamp(stat.st_ctime).strftime("%d.%m.%Y"),
-                'modification_time': datetime.fromtimestamp(stat.st_mtime).strftime("%d.%m.%Y"),
-                'extension': resolved_path.suffix,
-                'permissions': oct(stat.st_mode)[-3:],
-                'absolute_path': str(resolved_path.absolute())
-            }
+            stat = os.stat(resolved_path)
+        except FileNotFoundError:
+            self.logger.warning("File %s not found", resolved_path.name)
+            return {}
         except Exception as e:
-            print(f"Metadata retrieval failed: {str(e)}")
+            self.logger.error("Metadata retrieval failed: %s", e)
             return {}
+
+        return self._metadata_from_stat(resolved_path, stat)
+
+    def _scandir_metadata(self, file_paths: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+        """Internal: Collect metadata with one directory listing per parent.
+
+        Requested files are grouped by directory and matched against
+        os.scandir entries, whose cached stat data makes per-file stat calls
+        unnecessary. Directories that cannot be listed fall back to
+        _stat_metadata for their files.
+
+        Args:
+            file_paths: Relative paths to target files
+
+        Returns:
+            Dict: Mapping of each requested path to its metadata dictionary
+        """
+        groups: Dict[Path, Dict[str, List[str]]] = {}
+        for path in file_paths:
+            resolved = self._resolve_path(path)
+            groups.setdefault(resolved.parent, {}).setdefault(resolved.name, []).append(path)
+
+        result = {}
+        for directory, wanted in groups.items():
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        requested = wanted.get(entry.name)
+                        if requested is None:
+                            continue
+                        metadata = self._metadata_from_stat(directory / entry.name, entry.stat())
+                        for path in requested:
+                            result[path] = metadata
+            except OSError:
+                for name, requested in wanted.items():
+                    for path in requested:
+                        result[path] = self._stat_metadata(directory / name)
+                continue
+
+            for name, requested in wanted.items():
+                if requested[0] not in result:
+                    self.logger.warning("File %s not found", name)
+                    for path in requested:
+                        result[path] = {}
+
+        return {path: result[path] for path in file_paths}
+
+    def _metadata_from_stat(
+        self,
+        resolved_path: Path,
+        stat: os.stat_result
+    ) -> Dict[str, Optional[str]]:
+        """Internal: Format metadata dictionary from stat result.
+
+        Args:
+            resolved_path: Absolute path to target file
+            stat: Stat result for the file
+
+        Returns:
+            Dict: Metadata dictionary (see get_file_metadata)
+        """
+        return {
+            'size_bytes': stat.st_size,
+            'creation_time': _format_date(stat.st_ctime),
+            'modification_time': _format_date(stat.st_mtime),
+            'extension': resolved_path.suffix,
+            'permissions': oct(stat.st_mode)[-3:],
+            'absolute_path': os.fspath(resolved_path)
+        }
@@ -1,10 +1,49 @@
 """System resource monitoring module for pyAdmin package."""
 
-import psutil
+import logging
+import os
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
+
+import psutil
+
 from pyAdmin.utils import bytes_to_gb
 
+_logger = logging.getLogger("pyAdmin.SystemMonitor")
+
+# Seconds a cpu_freq() reading is reused before sampling again
+_FREQ_CACHE_TTL = 1.0
+
+
+def _cpu_busy_percent(previous, current) -> float:
+    """Compute CPU load between two psutil.cpu_times() samples.
+
+    Same formula as psutil.cpu_percent: guest time is already part of
+    user/nice, idle and iowait count as not busy.
+
+    Args:
+        previous: Earlier cpu_times() result
+        current: Later cpu_times() result
+
+    Returns:
+        float: Busy percentage rounded to one decimal place, 0.0 for an
+            empty interval
+    """
+    deltas = {
+        field: max(getattr(current, field) - getattr(previous, field), 0.0)
+        for field in current._fields
+    }
+    total = sum(deltas.values()) - deltas.get('guest', 0.0) - deltas.get('guest_nice', 0.0)
+    busy = total - deltas['idle'] - deltas.get('iowait', 0.0)
+    if total <= 0:
+        return 0.0
+    return round(min(max(busy / total * 100, 0.0), 100.0), 1)
+
 
 class SystemMonitor:
     """Monitor system resources and performance metrics using psutil.
@@ -17,36 +56,72 @@ class SystemMonitor:
     - Hardware temperatures (platform-dependent)
     - Process and uptime information
 
+    The parallel get_system_status keeps a small thread pool alive between
+    calls. Release it with close() or by using the monitor as a context
+    manager; an unreferenced monitor also stops it when collected.
+
     Attributes:
         psutil_available (bool): Indicates if psutil package is installed and available.
+
+    Example:
+        >>> with SystemMonitor() as monitor:
+        ...     status = monitor.get_system_status()
     """
 
     def __init__(self) -> None:
         """Initialize system monitor and verify psutil availability.
 
         Automatically checks for psutil installation during initialization.
-        Prints installation instructions if package is missing.
+        Logs installation instructions if package is missing.
+        Also takes the CPU times baseline for usage measurement and reads
+        core counts, which cannot change while the process runs
+        (see _get_cpu_usage).
         """
+        self.logger = _logger
         self.psutil_available = self._check_psutil()
+        self._cores = self._threads = None
+        self._freq_value = None
+        self._freq_time = float('-inf')
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._cpu_times = None
+        self._cpu_lock = threading.Lock()
+        if self.psutil_available:
+            self._cpu_times = psutil.cpu_times()
+            self._cores = psutil.cpu_count(logical=False)
+            self._threads = psutil.cpu_count(logical=True)
 
     @staticmethod
     def _check_psutil() -> bool:
         """Verify psutil package installation status.
 
+        Already imported psutil is found with a sys.modules lookup, without
+        going through the import machinery and its lock.
+
         Returns:
             bool: True if psutil is available, False otherwise
         """
+        if sys.modules.get('psutil') is not None:
+            return True
         try:
             import psutil
             return True
         except ImportError:
-            print("Error: psutil required for system monitoring.")
-            print("Install with: pip install psutil")
+            _logger.error(
+                "psutil required for system monitoring. Install with: pip install psutil"
+            )
             return False
 
-    def get_system_status(self) -> Dict:
+    def get_system_status(self, parallel: bool = True) -> Dict:
         """Get complete system status snapshot.
 
+        Args:
+            parallel (bool): Query the independent metrics concurrently in a
+                thread pool (psutil releases the GIL while reading /proc and
+                /sys), so the snapshot takes about as long as the slowest
+                reader instead of the sum of all of them. The pool threads
+                stay alive until close()
+
         Returns:
             Dict: Composite dictionary containing:
                 - disk: Disk usage statistics (see _get_disk_usage)
@@ -71,18 +146,100 @@ class SystemMonitor:
         if not self.psutil_available:
             return {}
 
+        collectors: Dict[str, Callable] = {
+            'disk': self._get_disk_usage,
+            'memory': self._get_memory_usage,
+            'cpu': self._get_cpu_usage,
+            'network': self._get_network_stats,
+            'swap': self._get_swap_usage,
+            'load_avg': self._get_load_average,
+            'uptime': self._get_uptime,
+            'temperatures': self._get_temperatures,
+            'process_count': self._get_process_count
+        }
+        if not parallel:
+            return {name: collect() for name, collect in collectors.items()}
+
+        pool = self._get_pool(len(collectors))
+        futures = {name: pool.submit(collect) for name, collect in collectors.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    def get_temperature_arrays(self) -> Dict[str, Dict[str, object]]:
+        """Get temperature sensor readings as parallel arrays per sensor.
+
+        Compact alternative to the 'temperatures' entry of get_system_status:
+        instead of one dict per reading, every sensor maps to a list of
+        labels and three float arrays of equal length, convenient for
+        vectorized threshold checks (e.g. numpy.frombuffer).
+
+        Returns:
+            Dict: {'sensor_name': {'labels': List[str], 'current': array,
+                'high': array, 'critical': array}}; missing thresholds are
+                NaN. Empty dict if sensors are unavailable.
+
+        Example:
+            >>> monitor.get_temperature_arrays()
+            {'coretemp': {'labels': ['Core 0', 'Core 1'],
+                          'current': array('d', [56.0, 54.0]),
+                          'high': array('d', [100.0, 100.0]),
+                          'critical': array('d', [100.0, 100.0])}}
+        """
+        if not self.psutil_available:
+            return {}
+        try:
+            temps = psutil.sensors_temperatures()
+        except AttributeError:
+            return {}
+
+        nan = float('nan')
         return {
-            'disk': self._get_disk_usage(),
-            'memory': self._get_memory_usage(),
-            'cpu': self._get_cpu_usage(),
-            'network': self._get_network_stats(),
-            'swap': self._get_swap_usage(),
-            'load_avg': self._get_load_average(),
-            'uptime': self._get_uptime(),
-            'temperatures': self._get_temperatures(),
-            'process_count': self._get_process_count()
+            sensor: {
+                'labels': [entry.label for entry in entries],
+                'current': array('d', [entry.current for entry in entries]),
+                'high': array('d', [
+                    nan if entry.high is None else entry.high for entry in entries
+                ]),
+                'critical': array('d', [
+                    nan if entry.critical is None else entry.critical for entry in entries
+                ])
+            }
+            for sensor, entries in temps.items()
         }
 
+    def close(self) -> None:
+        """Stop worker threads used by get_system_status.
+
+        The monitor stays usable; a new pool is created on demand.
+        """
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def __enter__(self) -> 'SystemMonitor':
+        """Return the monitor itself for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Release worker threads on leaving the with block."""
+        self.close()
+
+    def __del__(self):
+        """Cleanup: Stop worker threads of a monitor that was not closed."""
+        pool = getattr(self, '_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _get_pool(self, workers: int) -> ThreadPoolExecutor:
+        """Internal: Return the metrics thread pool, creating it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix="SystemMonitor"
+                )
+            return self._pool
+
     def _get_disk_usage(self) -> Dict[str, float]:
         """Get root partition disk usage statistics.
 
@@ -100,9 +257,9 @@ class SystemMonitor:
         """
         disk = psutil.disk_usage('/')
         return {
-            'total_gb': round(bytes_to_gb(disk.total), 2),
-            'used_gb': round(bytes_to_gb(disk.used), 2),
-            'free_gb': round(bytes_to_gb(disk.free), 2),
+            'total_gb': bytes_to_gb(disk.total),
+            'used_gb': bytes_to_gb(disk.used),
+            'free_gb': bytes_to_gb(disk.free),
             'percent_used': disk.percent
         }
 
@@ -123,18 +280,27 @@ class SystemMonitor:
         """
         memory = psutil.virtual_memory()
         return {
-            'total_gb': round(bytes_to_gb(memory.total), 2),
-            'available_gb': round(bytes_to_gb(memory.available), 2),
-            'used_gb': round(bytes_to_gb(memory.used), 2),
+            'total_gb': bytes_to_gb(memory.total),
+            'available_gb': bytes_to_gb(memory.available),
+            'used_gb': bytes_to_gb(memory.used),
             'percent_used': memory.percent
         }
 
     def _get_cpu_usage(self) -> Dict[str, Optional[float]]:
         """Collect CPU performance metrics.
 
+        Does not block: usage is averaged over the time since the previous
+        call (or since the monitor was created), so frequently polled
+        monitors report short windows and rarely polled ones long windows.
+        The baseline belongs to the monitor, not to the calling thread as
+        with psutil.cpu_percent(interval=None), so calls from pool workers
+        or other threads all measure consecutive windows.
+        Core counts are read once at init and the frequency is reused for
+        up to one second.
+
         Returns:
             Dict: CPU metrics with keys:
-                - usage_percent: Current load percentage (float)
+                - usage_percent: Load percentage since last call (float)
                 - cores: Physical core count (int)
                 - threads: Logical thread count (int)
                 - frequency: Current clock speed (GHz) (float or None if unavailable)
@@ -145,12 +311,27 @@ class SystemMonitor:
                  'threads': 8, 'frequency': 3.6}
         """
         return {
-            'usage_percent': psutil.cpu_percent(interval=0.5),
-            'cores': psutil.cpu_count(logical=False),
-            'threads': psutil.cpu_count(logical=True),
-            'frequency': getattr(psutil.cpu_freq(), 'current', None)
+            'usage_percent': self._get_cpu_percent(),
+            'cores': self._cores,
+            'threads': self._threads,
+            'frequency': self._get_cpu_frequency()
         }
 
+    def _get_cpu_percent(self) -> float:
+        """Return CPU load since the previous sample and start a new window."""
+        with self._cpu_lock:
+            current = psutil.cpu_times()
+            previous, self._cpu_times = self._cpu_times, current
+        return _cpu_busy_percent(previous, current)
+
+    def _get_cpu_frequency(self) -> Optional[float]:
+        """Return current CPU frequency, cached for _FREQ_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if now - self._freq_time >= _FREQ_CACHE_TTL:
+            self._freq_value = getattr(psutil.cpu_freq(), 'current', None)
+            self._freq_time = now
+        return self._freq_value
+
     def _get_network_stats(self) -> Dict[str, int]:
         """Get network input/output counters.
 
@@ -191,9 +372,9 @@ class SystemMonitor:
         """
         swap = psutil.swap_memory()
         return {
-            'total_gb': round(bytes_to_gb(swap.total), 2),
-            'used_gb': round(bytes_to_gb(swap.used), 2),
-            'free_gb': round(bytes_to_gb(swap.free), 2),
+            'total_gb': bytes_to_gb(swap.total),
+            'used_gb': bytes_to_gb(swap.used),
+            'free_gb': bytes_to_gb(swap.free),
             'percent_used': swap.percent
         }
 
@@ -278,6 +459,9 @@ class SystemMonitor:
     def _get_process_count(self) -> int:
         """Count currently running processes.
 
+        On Linux the numeric entries of /proc are counted directly, without
+        building the PID list that psutil.pids() returns.
+
         Returns:
             Integer representing number of active processes
 
@@ -285,4 +469,10 @@ class SystemMonitor:
             >>> monitor._get_process_count()
             137  # Typical value for desktop system
         """
+        if psutil.LINUX:
+            try:
+                with os.scandir('/proc') as entries:
+                    return sum(1 for entry in entries if entry.name.isdigit())
+            except OSError:
+                pass
         return len(psutil.pids())
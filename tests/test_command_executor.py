@@ -6,17 +6,21 @@ from datetime import datetime, timedelta
 import subprocess
 import time
 import os
+import re
 import sys
 import logging
 from unittest.mock import Mock, patch
 from pyAdmin.command_executor import CommandExecutor
 
+# Признаки листинга каталога в любой локализации dir
+_DIR_LISTING = re.compile(r"Directory|Папка|<DIR>")
+
 @pytest.fixture
 def executor():
     ex = CommandExecutor(log_file="test.log")
     ex.logger.setLevel(logging.CRITICAL)
     yield ex
-    ex.pause_scheduler()
+    ex.close()
 
 def test_execute_command_basic(executor):
     """Test basic command execution"""
@@ -24,6 +28,52 @@ def test_execute_command_basic(executor):
     assert code == 0
     assert "Hello" in stdout
 
+def test_execute_command_builtins(executor):
+    """Тест выполнения простых встроенных команд без запуска оболочки"""
+    with patch("pyAdmin.command_executor.subprocess.run", side_effect=AssertionError) as mock_run:
+        assert executor.execute_command("echo Fast path") == ("Fast path\n", "", 0)
+        assert executor.execute_command("cd .") == ("", "", 0)
+        assert not mock_run.called
+
+def test_execute_command_builtins_fallback(executor):
+    """Тест передачи оболочке команд, которые нельзя эмулировать"""
+    executor.set_environment({"BUILTIN_VAR": "expanded"})
+    cmd = "echo %BUILTIN_VAR%" if sys.platform == "win32" else "echo $BUILTIN_VAR"
+    stdout, stderr, code = executor.execute_command(cmd)
+    assert "expanded" in stdout
+
+    stdout, stderr, code = executor.execute_command("cd missing_dir_xyz")
+    assert code != 0
+
+    with patch("pyAdmin.command_executor.subprocess.run") as mock_run:
+        mock_run.return_value = Mock(stdout="x\n", stderr="", returncode=0)
+        executor.execute_command("echo x", allow_builtins=False)
+        assert mock_run.called
+
+def test_execute_command_builtin_missing_cwd(executor, tmp_path):
+    """Встроенная команда с несуществующим cwd завершается ошибкой, как subprocess"""
+    missing = str(tmp_path / "missing_dir")
+    stdout, stderr, code = executor.execute_command("echo hi", cwd=missing)
+    assert code == -1
+    assert "Execution failed" in stderr
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Постоянная оболочка только для POSIX")
+def test_execute_command_persistent(executor, tmp_path):
+    """Тест выполнения команд в постоянной оболочке"""
+    assert executor.execute_command("echo $((2 + 3))", persistent=True) == ("5\n", "", 0)
+    assert executor.execute_command("echo err >&2; exit 3", persistent=True) == ("", "err\n", 3)
+    # Состояние не переносится между командами
+    executor.execute_command("cd /; FOO=bar", persistent=True)
+    stdout, _, _ = executor.execute_command("pwd; echo \"[$FOO]\"", cwd=str(tmp_path), persistent=True)
+    assert stdout == f"{tmp_path}\n[]\n"
+
+    executor.set_environment({"PERSIST_VAR": "new"})
+    assert executor.execute_command("printf %s $PERSIST_VAR", persistent=True)[0] == "new"
+
+    stdout, stderr, code = executor.execute_command("sleep 5", timeout=0.5, persistent=True)
+    assert code == -1 and "timed out" in stderr
+    assert executor.execute_command("echo alive", persistent=True)[0] == "alive\n"
+
 def test_schedule_command(executor):
     """Test task scheduling"""
     task_id = executor.schedule_command("echo Test", interval=1)
@@ -37,7 +87,7 @@ def test_windows_specific(executor):
     stdout, stderr, code = executor.execute_command("dir")
     assert code == 0
     # Универсальная проверка для любой локализации
-    assert any(keyword in stdout for keyword in ["Directory", "Папка", "<DIR>"])
+    assert _DIR_LISTING.search(stdout)
     assert "байт" in stdout  # Проверка наличия информации о размере
 
 def test_complex_command_sequence(executor):
@@ -63,6 +113,82 @@ def test_complex_command_sequence(executor):
             else:
                 shutil.rmtree("test_dir", ignore_errors=True)
 
+def test_schedule_subsecond_interval(executor):
+    """Тест интервалов меньше секунды"""
+    done = threading.Event()
+    calls = []
+
+    def on_run(stdout, stderr, code):
+        calls.append(code)
+        if len(calls) == 3:
+            done.set()
+
+    executor.schedule_command("echo Fast", interval=0.2, max_runs=3, callback=on_run)
+    assert done.wait(timeout=2), "Задача не выполнилась 3 раза"
+
+def test_schedule_command_rejects_zero_interval(executor):
+    """Тест отказа от интервала 0, который загружал бы планировщик без пауз"""
+    with pytest.raises(ValueError):
+        executor.schedule_command("echo Spin", interval=0)
+    with pytest.raises(ValueError):
+        executor.schedule_command("echo Spin", interval=-1)
+    assert executor.get_scheduled_tasks() == {}
+
+def test_scheduler_slow_task_max_runs(executor):
+    """Тест: медленная задача не запускается повторно до завершения и не превышает max_runs"""
+    runs = []
+    done = threading.Event()
+    submit = executor._task_pool.submit
+    submitted = []
+
+    def counting_submit(*args, **kwargs):
+        submitted.append(args)
+        return submit(*args, **kwargs)
+
+    def on_run(stdout, stderr, code):
+        runs.append(time.monotonic())
+        if len(runs) == 2:
+            done.set()
+
+    executor._task_pool.submit = counting_submit
+    cmd = f'"{sys.executable}" -c "import time; time.sleep(0.5)"'
+    task_id = executor.schedule_command(cmd, interval=0.01, max_runs=2, callback=on_run)
+    assert done.wait(timeout=5), "Задача не выполнилась 2 раза"
+    time.sleep(0.3)
+
+    assert len(runs) == 2
+    assert len(submitted) == 2
+    assert runs[1] - runs[0] >= 0.5  # Запуски не перекрываются
+    assert task_id not in executor.get_scheduled_tasks()
+
+def test_scheduler_tiny_interval_rate_limited(executor):
+    """Тест: крошечный интервал не превращает цикл планировщика в активное ожидание"""
+    runs = []
+    task_id = executor.schedule_command(
+        "echo Tick", interval=1e-9, callback=lambda out, err, code: runs.append(code)
+    )
+    time.sleep(0.5)
+    executor.remove_scheduled_task(task_id)
+    # Не чаще одного запуска на 10 мс после завершения предыдущего
+    assert 0 < len(runs) <= 50
+
+def test_scheduler_wakes_for_earlier_task(executor):
+    """Тест немедленного пробуждения планировщика для более ранней задачи"""
+    executor.schedule_at("echo Later", datetime.now() + timedelta(hours=1))
+    time.sleep(0.1)  # Планировщик ждёт задачу через час
+
+    done = threading.Event()
+    executor.schedule_at(
+        "echo Soon",
+        datetime.now() + timedelta(seconds=0.2),
+        lambda out, err, code: done.set()
+    )
+    assert done.wait(timeout=0.8), "Новая задача не разбудила планировщик"
+
+    started = time.monotonic()
+    executor.pause_scheduler()
+    assert time.monotonic() - started < 0.5
+
 def test_scheduled_task_removal(executor):
     """Тест удаления задачи"""
     task_id = executor.schedule_command("echo Test", interval=1)
@@ -85,6 +211,31 @@ def test_realtime_output(executor):
     assert code == 0
     mock_callback.assert_called_with("Realtime Test")
 
+def test_realtime_output_chunked_lines(executor):
+    """Тест разбиения потокового вывода на строки между порциями"""
+    stream = Mock()
+    stream.read1.side_effect = [b"first\r", b"\nsecond\nthi", b"rd", b""]
+    lines = list(executor._iter_output_lines(stream))
+    assert lines == ["first", "second", "third"]
+
+def test_realtime_output_slow_callback(executor):
+    """Тест чтения канала в отдельном потоке при медленном обработчике"""
+    lines = []
+    def slow_callback(line):
+        time.sleep(0.001)
+        lines.append(line)
+
+    cmd = f'"{sys.executable}" -c "for i in range(1000): print(i)"'
+    code = executor.realtime_output(cmd, slow_callback)
+    assert code == 0
+    assert lines == [str(i) for i in range(1000)]
+
+def test_realtime_output_callback_error(executor):
+    """Тест остановки потока чтения при ошибке в обработчике"""
+    cmd = f'"{sys.executable}" -c "for i in range(5000): print(i)"'
+    code = executor.realtime_output(cmd, Mock(side_effect=ValueError("stop")))
+    assert code == -1
+
 def test_environment_management(executor):
     """Тестирование управления переменными окружения"""
     executor.set_environment({"TEST_ENV": "123"})
@@ -93,6 +244,20 @@ def test_environment_management(executor):
     executor.reset_environment()
     assert "TEST_ENV" not in executor.export_environment()
 
+def test_environment_shared_between_commands(executor):
+    """Окружение собирается один раз и передаётся без копирования"""
+    executor.set_environment({"TEST_ENV": "123"})
+    with patch("pyAdmin.command_executor.subprocess.run") as mock_run:
+        mock_run.return_value = Mock(stdout="", stderr="", returncode=0)
+        executor.execute_command("first", allow_builtins=False)
+        executor.execute_command("second", allow_builtins=False)
+
+    first_env, second_env = (c.kwargs["env"] for c in mock_run.call_args_list)
+    assert first_env is second_env
+    assert first_env["TEST_ENV"] == "123"
+    with pytest.raises(TypeError):
+        first_env["TEST_ENV"] = "456"
+
 def test_working_directory(executor):
     """Тестирование смены рабочей директории"""
     test_dir = "test_dir_123"
@@ -122,24 +287,21 @@ def test_admin_execution(executor):
     mock_process = Mock()
     mock_process.stdout = Mock()
 
-    # Генератор вывода для readline
-    def readline_gen():
-        yield "Admin\n"
-        yield ""
-        while True:
-            yield ""
-
-    mock_process.stdout.readline.side_effect = readline_gen()
-    mock_process.poll.side_effect = [None, 0]
+    # Вывод процесса порциями байтов
+    mock_process.stdout.read1.side_effect = [b"Admin\r\n", b""]
+    mock_process.wait.return_value = 0
     mock_process.returncode = 0
 
     mock_callback = Mock()
 
-    with patch("pyAdmin.command_executor.subprocess.Popen", return_value=mock_process):
+    with patch("pyAdmin.command_executor.subprocess.Popen", return_value=mock_process) as mock_popen:
         code = executor.realtime_output("echo Admin", mock_callback, admin=True)
 
         assert code == 0
         mock_callback.assert_called_with("Admin")
+        args, kwargs = mock_popen.call_args
+        assert args[0][:3] == ["powershell", "-NoProfile", "-Command"]
+        assert not kwargs.get("shell")
 
 def test_error_handling(executor):
     """Тестирование обработки ошибок"""
@@ -196,6 +358,7 @@ def test_thread_safety(executor):
         tasks = list(pool.map(schedule_task, range(10)))
     
     assert len(executor.get_scheduled_tasks()) == 10
+    assert len(set(tasks)) == 10
 
 def test_execute_command_timeout(executor):
     """Тест обработки таймаута команды"""
@@ -240,6 +403,30 @@ def test_validate_command_invalid(executor):
     """Тест проверки несуществующей команды"""
     assert not executor.validate_command("nonexistent_command_123")
 
+def test_environment_passed_to_command(executor):
+    """Тест передачи переменных окружения в команду"""
+    executor.set_environment({"PYADMIN_TEST_VAR": "visible"})
+    cmd = "echo %PYADMIN_TEST_VAR%" if sys.platform == "win32" else "echo $PYADMIN_TEST_VAR"
+    stdout, stderr, code = executor.execute_command(cmd)
+    assert "visible" in stdout
+
+    executor.reset_environment()
+    stdout, stderr, code = executor.execute_command(cmd)
+    assert "visible" not in stdout
+
+def test_validate_command_cached(executor):
+    """Тест кеширования поиска команд в PATH"""
+    executor.clear_command_cache()
+    with patch("pyAdmin.command_executor.shutil.which", return_value="/bin/tool") as mock_which:
+        assert executor.validate_command("cached_tool_xyz --flag")
+        assert executor.validate_command("cached_tool_xyz")
+        assert mock_which.call_count == 1
+
+        executor.clear_command_cache()
+        assert executor.validate_command("cached_tool_xyz")
+        assert mock_which.call_count == 2
+    executor.clear_command_cache()
+
 def test_set_environment_update(executor):
     """Тест обновления переменных окружения"""
     executor.set_environment({"KEY1": "val1", "KEY2": "val2"})
@@ -259,7 +446,29 @@ def test_trigger_invalid_task(executor):
     """Тест запуска несуществующей задачи"""
     with patch.object(executor.logger, 'error') as mock_log:
         executor._trigger_task(999)
-        mock_log.assert_called_with("Failed to trigger missing task 999")
+        mock_log.assert_called_with("Failed to trigger missing task %s", 999)
+
+def test_close_flushes_log(tmp_path):
+    """Тест записи журнала через очередь при закрытии"""
+    log_file = tmp_path / "queued.log"
+    ex = CommandExecutor(log_file=str(log_file))
+    ex.logger.info("Queued record")
+    ex.close()
+    assert "Queued record" in log_file.read_text()
+    ex.close()  # Повторное закрытие не должно падать
+
+def test_close_cancels_queued_runs(tmp_path):
+    """Тест отмены ещё не начатых запусков задач при закрытии"""
+    ex = CommandExecutor(log_file=str(tmp_path / "cancel.log"))
+    ex.logger.setLevel(logging.CRITICAL)
+    finished = []
+    cmd = f'"{sys.executable}" -c "import time; time.sleep(0.5)"'
+    for _ in range(12):  # Пул из 8 потоков, 4 запуска ждут в очереди
+        ex.schedule_command(cmd, interval=60, immediate_run=True,
+                            callback=lambda out, err, code: finished.append(code))
+    ex.close()
+    time.sleep(1.5)
+    assert len(finished) == 8
 
 def test_resume_running_scheduler(executor):
     """Тест возобновления уже работающего планировщика"""
@@ -275,12 +484,35 @@ def test_start_scheduler_alive(executor):
         executor._start_scheduler()
         mock_log.assert_called_with("Scheduler thread already running")
 
+def test_scheduler_monotonic_deadlines(executor):
+    """Сроки задач хранятся по монотонным часам в наносекундах"""
+    executor.schedule_at("echo Later", datetime.now() + timedelta(hours=1))
+    run_at, _ = executor._task_heap[0]
+    assert isinstance(run_at, int)
+    assert abs(run_at - time.monotonic_ns() - 3600 * 10**9) < 10**9
+    assert 3599 < executor._next_wait_timeout() <= 3600
+
 def test_handle_task_removal(executor):
     """Тест внутренней очистки задач"""
     task_id = executor.schedule_command("echo Cleanup", interval=10)
     executor._handle_task_removal(task_id)
     assert task_id not in executor.scheduled_tasks
 
+def test_scheduled_tasks_snapshot_reuse(executor):
+    """Тест повторного использования снимка задач без изменений"""
+    task_id = executor.schedule_at("echo Later", datetime.now() + timedelta(hours=1))
+
+    first = executor.get_scheduled_tasks()
+    second = executor.get_scheduled_tasks()
+    assert first is not second
+    assert first[task_id] is second[task_id]
+    with pytest.raises(TypeError):
+        first[task_id]["active"] = False  # Общие записи только для чтения
+    assert executor.get_scheduled_tasks()[task_id]["active"] is True
+
+    executor.remove_scheduled_task(task_id)
+    assert task_id not in executor.get_scheduled_tasks()
+
 def test_set_invalid_working_directory(executor):
     """Тест установки неверного рабочего каталога"""
     with pytest.raises(NotADirectoryError):
@@ -331,7 +563,7 @@ def test_trigger_nonexistent_task(executor):
     """Тест триггера несуществующей задачи"""
     with patch.object(executor.logger, 'error') as mock_log:
         executor._trigger_task(9999)
-        mock_log.assert_called_with("Failed to trigger missing task 9999")
+        mock_log.assert_called_with("Failed to trigger missing task %s", 9999)
 
 def test_task_validation_edge_cases(executor):
     """Тест валидации структуры задач"""
@@ -1,7 +1,13 @@
+import errno
+import logging
+import os
 import pytest
 import shutil
 import stat
+import sys
+import time
 from pathlib import Path
+from pyAdmin import file_manager
 from pyAdmin.file_manager import FileManager
 import zipfile
 
@@ -10,6 +16,12 @@ def test_caller_dir():
     expected_dir = Path(__file__).parent.resolve()
     assert fm.caller_dir == expected_dir
 
+def test_caller_dir_without_source(tmp_path, monkeypatch):
+    """Тест базовой директории для кода без исходного файла"""
+    monkeypatch.chdir(tmp_path)
+    fm = eval("FileManager()")
+    assert fm.caller_dir == Path.cwd()
+
 def test_resolve_path():
     fm = FileManager()
     test_path = "test.txt"
@@ -17,6 +29,26 @@ def test_resolve_path():
     expected = Path(__file__).parent.resolve() / test_path
     assert resolved == expected
 
+@pytest.mark.skipif(sys.platform == "win32", reason="Symlinks require privileges on Windows")
+def test_resolve_path_cache(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(target)
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm._resolve_path("link") == target
+
+    other = tmp_path / "other"
+    other.mkdir()
+    link.unlink()
+    link.symlink_to(other)
+    assert fm._resolve_path("link") == target  # Результат из кеша
+
+    fm.clear_path_cache()
+    assert fm._resolve_path("link") == other
+
 def test_copy_file_success(tmp_path):
     src = tmp_path / "source.txt"
     src.write_text("test")
@@ -27,11 +59,135 @@ def test_copy_file_success(tmp_path):
     assert fm.copy_file(src.name, dest.relative_to(tmp_path)) is True
     assert dest.exists()
 
+def test_copy_file_large_content(tmp_path):
+    """Тест побайтового совпадения копии файла размером в несколько мегабайт"""
+    data = bytes(range(256)) * (3 * 4096 + 7)
+    (tmp_path / "big.bin").write_bytes(data)
+    (tmp_path / "copy.bin").write_bytes(b"old content longer than nothing")
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.copy_file("big.bin", "copy.bin") is True
+    assert (tmp_path / "copy.bin").read_bytes() == data
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range недоступен")
+def test_copy_file_range_fallback(tmp_path, monkeypatch):
+    """Тест перехода на sendfile при отказе copy_file_range"""
+    (tmp_path / "src.txt").write_text("fallback")
+
+    def refuse(*args, **kwargs):
+        raise OSError(errno.EXDEV, "Cross-device link")
+
+    monkeypatch.setattr(os, "copy_file_range", refuse)
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.copy_file("src.txt", "dst.txt") is True
+    assert (tmp_path / "dst.txt").read_text() == "fallback"
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range недоступен")
+def test_copy_file_userspace_fallback(tmp_path, monkeypatch):
+    """Тест копирования через read/write при отказе всех системных вызовов"""
+    data = b"x" * (3 * 1024 * 1024 + 5)
+    (tmp_path / "src.bin").write_bytes(data)
+
+    def refuse(*args, **kwargs):
+        raise OSError(errno.EINVAL, "Invalid argument")
+
+    monkeypatch.setattr(os, "copy_file_range", refuse)
+    monkeypatch.setattr(os, "sendfile", refuse)
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.copy_file("src.bin", "dst.bin") is True
+    assert (tmp_path / "dst.bin").read_bytes() == data
+
+def test_copy_file_preserves_metadata(tmp_path):
+    """Тест сохранения прав доступа и времени изменения"""
+    src = tmp_path / "src.txt"
+    src.write_text("meta")
+    src.chmod(0o640)
+    os.utime(src, (1_600_000_000, 1_600_000_000))
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.copy_file("src.txt", "dst.txt") is True
+    dst_stat = (tmp_path / "dst.txt").stat()
+    assert dst_stat.st_mtime == 1_600_000_000
+    if sys.platform != "win32":
+        assert stat.S_IMODE(dst_stat.st_mode) == 0o640
+
+def test_copy_file_same_file(tmp_path):
+    """Тест защиты от копирования файла самого в себя"""
+    (tmp_path / "same.txt").write_text("keep me")
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.copy_file("same.txt", "same.txt") is False
+    assert (tmp_path / "same.txt").read_text() == "keep me"
+
+def test_copy_file_directory_source(tmp_path):
+    """Папка как источник не затирает существующий файл назначения"""
+    (tmp_path / "somedir").mkdir()
+    (tmp_path / "existing.txt").write_text("keep me")
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.copy_file("somedir", "existing.txt") is False
+    assert (tmp_path / "existing.txt").read_text() == "keep me"
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFO только в POSIX")
+def test_copy_file_fifo_source(tmp_path):
+    """Именованный канал как источник не блокирует копирование"""
+    os.mkfifo(tmp_path / "pipe")
+    (tmp_path / "existing.txt").write_text("keep me")
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.copy_file("pipe", "existing.txt") is False
+    assert (tmp_path / "existing.txt").read_text() == "keep me"
+
 def test_copy_file_not_found(tmp_path):
     fm = FileManager()
     fm.caller_dir = tmp_path
     assert fm.copy_file("nonexistent.txt", "dest.txt") is False
 
+def test_copy_file_into_directory(tmp_path):
+    """Копирование в существующую папку сохраняет имя файла"""
+    (tmp_path / "a.txt").write_text("data")
+    (tmp_path / "backup").mkdir()
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.copy_file("a.txt", "backup")
+    assert (tmp_path / "backup" / "a.txt").read_text() == "data"
+
+    (tmp_path / "b.txt").write_text("more")
+    assert fm.copy_files([("b.txt", "backup")]) == [True]
+    assert (tmp_path / "backup" / "b.txt").read_text() == "more"
+
+def test_copy_files_batch(tmp_path):
+    for i in range(20):
+        (tmp_path / f"f{i}.txt").write_text(str(i))
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    pairs = [(f"f{i}.txt", f"out/sub{i % 3}/f{i}.txt") for i in range(20)]
+    results = fm.copy_files(pairs + [("ghost.txt", "out/ghost.txt")])
+
+    assert results == [True] * 20 + [False]
+    for i in range(20):
+        assert (tmp_path / "out" / f"sub{i % 3}" / f"f{i}.txt").read_text() == str(i)
+
+def test_move_files_batch(tmp_path):
+    for name in ("a.log", "b.log"):
+        (tmp_path / name).write_text(name)
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.move_files([("a.log", "logs/a.log"), ("b.log", "logs/b.log")]) == [True, True]
+    assert not (tmp_path / "a.log").exists()
+    assert (tmp_path / "logs" / "b.log").read_text() == "b.log"
+    assert fm.move_files([]) == []
+
 def test_move_file_success(tmp_path):
     src = tmp_path / "file.txt"
     src.write_text("content")
@@ -55,6 +211,115 @@ def test_compress_files(tmp_path):
     zip_path = tmp_path / "test.zip"
     with zipfile.ZipFile(zip_path) as z:
         assert len(z.namelist()) == 2
+        for f in files:
+            expected = zipfile.ZipInfo.from_file(f, arcname=f.name)
+            member = z.getinfo(f.name)
+            # ZIP хранит секунды с шагом 2
+            assert member.date_time[:5] == expected.date_time[:5]
+            assert member.date_time[5] == expected.date_time[5] // 2 * 2
+            assert member.external_attr == expected.external_attr
+
+@pytest.mark.parametrize("use_libdeflate", [True, False])
+def test_compress_files_content(tmp_path, monkeypatch, use_libdeflate):
+    if use_libdeflate:
+        if file_manager._libdeflate is None:
+            pytest.skip("deflate не установлен")
+    else:
+        monkeypatch.setattr(file_manager, "_libdeflate", None)
+    data = b"0123456789abcdef" * (192 * 1024)  # 3 MiB, несколько блоков
+    (tmp_path / "big.bin").write_bytes(data)
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.compress_files(["big.bin"], "big.zip") is True
+
+    with zipfile.ZipFile(tmp_path / "big.zip") as z:
+        assert z.testzip() is None
+        assert z.read("big.bin") == data
+
+def test_compress_files_level(tmp_path):
+    data = b"level test line\n" * 65536
+    (tmp_path / "data.txt").write_bytes(data)
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.compress_files(["data.txt"], "stored.zip", level=0) is True
+    assert fm.compress_files(["data.txt"], "best.zip", level=9) is True
+
+    with zipfile.ZipFile(tmp_path / "stored.zip") as z:
+        assert z.testzip() is None
+        assert z.read("data.txt") == data
+        assert z.getinfo("data.txt").compress_type == zipfile.ZIP_STORED
+        stored_size = z.getinfo("data.txt").compress_size
+    with zipfile.ZipFile(tmp_path / "best.zip") as z:
+        assert z.read("data.txt") == data
+        assert z.getinfo("data.txt").compress_size < stored_size
+
+    with pytest.raises(ValueError):
+        fm.compress_files(["data.txt"], "bad.zip", level=10)
+
+def test_compress_small_files_window(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_manager, "_libdeflate", None)
+    contents = {f"s{n}.txt": (b"ab" * n)[:n] for n in (1, 255, 256, 4097, 70000)}
+    for name, data in contents.items():
+        (tmp_path / name).write_bytes(data)
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.compress_files(list(contents), "small.zip") is True
+    with zipfile.ZipFile(tmp_path / "small.zip") as z:
+        assert z.testzip() is None
+        for name, data in contents.items():
+            assert z.read(name) == data
+
+def test_compress_files_stored_many(tmp_path):
+    contents = {f"m{n}.bin": bytes([n]) * (n * 1000) for n in range(6)}
+    for name, data in contents.items():
+        (tmp_path / name).write_bytes(data)
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.compress_files(list(contents), "stored.zip", level=0) is True
+    with zipfile.ZipFile(tmp_path / "stored.zip") as z:
+        assert z.testzip() is None
+        assert {name: z.read(name) for name in z.namelist()} == contents
+
+@pytest.mark.parametrize("use_libdeflate", [True, False])
+def test_compress_files_spooled(tmp_path, monkeypatch, use_libdeflate):
+    """Большие файлы сжимаются порциями через временный файл"""
+    if not use_libdeflate:
+        monkeypatch.setattr(file_manager, "_libdeflate", None)
+    monkeypatch.setattr(file_manager, "_SPOOL_THRESHOLD", 64 * 1024)
+    monkeypatch.setattr(file_manager, "_CHUNK_SIZE", 16 * 1024)
+    monkeypatch.setattr(file_manager, "_MAX_PENDING_BYTES", 128 * 1024)
+    contents = {
+        "random.bin": os.urandom(300 * 1024),  # не сжимается, уходит на диск
+        "text.log": b"log line\n" * 40000,      # остаётся в памяти
+        "small.txt": b"small"
+    }
+    for name, data in contents.items():
+        (tmp_path / name).write_bytes(data)
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.compress_files(list(contents), "spooled.zip") is True
+    with zipfile.ZipFile(tmp_path / "spooled.zip") as z:
+        assert z.testzip() is None
+        assert {name: z.read(name) for name in z.namelist()} == contents
+
+def test_compress_files_without_mmap(tmp_path, monkeypatch):
+    data = b"unmappable" * 100000
+    (tmp_path / "plain.bin").write_bytes(data)
+
+    def refuse(*args, **kwargs):
+        raise OSError("mmap not supported")
+
+    monkeypatch.setattr(file_manager.mmap, "mmap", refuse)
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    assert fm.compress_files(["plain.bin"], "plain.zip") is True
+    with zipfile.ZipFile(tmp_path / "plain.zip") as z:
+        assert z.read("plain.bin") == data
 
 def test_get_file_metadata(tmp_path):
     test_file = tmp_path / "meta.txt"
@@ -67,13 +332,47 @@ def test_get_file_metadata(tmp_path):
     assert meta['size_bytes'] == 8
     assert meta['extension'] == '.txt'
     assert 'absolute_path' in meta
+    expected = time.strftime("%d.%m.%Y", time.localtime(test_file.stat().st_mtime))
+    assert meta['modification_time'] == expected
+
+def test_get_file_metadata_batch(tmp_path):
+    (tmp_path / "one.txt").write_text("1")
+    (tmp_path / "two.log").write_text("22")
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    meta = fm.get_file_metadata_batch(["one.txt", "two.log", "ghost.file"])
+
+    assert meta["one.txt"]["size_bytes"] == 1
+    assert meta["two.log"]["extension"] == ".log"
+    assert meta["two.log"] == fm.get_file_metadata("two.log")
+    assert meta["ghost.file"] == {}
+    assert fm.get_file_metadata_batch(["one.txt", "two.log", "ghost.file"], parallel=True) == meta
+
+def test_get_file_metadata_batch_scandir(tmp_path, monkeypatch):
+    """Пакетные метаданные через os.scandir совпадают с поштучными"""
+    (tmp_path / "one.txt").write_text("1")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "two.log").write_text("22")
+    monkeypatch.setattr(file_manager, '_SCANDIR_STAT', True)
+
+    fm = FileManager()
+    fm.caller_dir = tmp_path
+    names = ["one.txt", "sub/two.log", "ghost.file", "missing_dir/x.txt"]
+    meta = fm.get_file_metadata_batch(names)
+
+    assert list(meta) == names
+    assert meta["one.txt"] == fm.get_file_metadata("one.txt")
+    assert meta["sub/two.log"] == fm.get_file_metadata("sub/two.log")
+    assert meta["ghost.file"] == {}
+    assert meta["missing_dir/x.txt"] == {}
 
 def test_copy_file_generic_error(tmp_path, monkeypatch):
     """Общий Exception при копировании"""
     fm = FileManager()
     fm.caller_dir = tmp_path
 
-def test_copy_file_generic_error(tmp_path, monkeypatch, capsys):
+def test_copy_file_generic_error(tmp_path, monkeypatch, caplog):
     fm = FileManager()
     fm.caller_dir = tmp_path
     (tmp_path / "dummy.txt").touch()
@@ -81,14 +380,13 @@ def test_copy_file_generic_error(tmp_path, monkeypatch, capsys):
     def mock_copy(*args, **kwargs):
         raise RuntimeError("Simulated error")
 
-    monkeypatch.setattr(shutil, 'copy', mock_copy)
+    monkeypatch.setattr(file_manager, '_fast_copy', mock_copy)
     
     result = fm.copy_file("dummy.txt", "error.txt")
-    captured = capsys.readouterr()
-    assert "Copy error: Simulated error" in captured.out
+    assert "Copy error: Simulated error" in caplog.text
     assert result is False
 
-def test_move_file_generic_error(tmp_path, monkeypatch, capsys):
+def test_move_file_generic_error(tmp_path, monkeypatch, caplog):
     fm = FileManager()
     fm.caller_dir = tmp_path
     (tmp_path / "test.txt").touch()
@@ -99,36 +397,33 @@ def test_move_file_generic_error(tmp_path, monkeypatch, capsys):
     monkeypatch.setattr(shutil, 'move', mock_move)
     
     result = fm.move_file("test.txt", "error.txt")
-    captured = capsys.readouterr()
-    assert "Move error: Move failed" in captured.out
+    assert "Move error: Move failed" in caplog.text
     assert result is False
 
-def test_compress_invalid_files(tmp_path, capsys):
+def test_compress_invalid_files(tmp_path, caplog):
     fm = FileManager()
     fm.caller_dir = tmp_path
     dir_path = tmp_path / "empty_dir"
     dir_path.mkdir()
     
     result = fm.compress_files([dir_path.name, "ghost.file"], "test.zip")
-    captured = capsys.readouterr()
-    assert "Skipping" in captured.out
+    assert "Skipping 2 entries" in caplog.text
     assert result is False
 
-def test_compress_empty_archive(tmp_path, capsys):
+def test_compress_empty_archive(tmp_path, caplog):
     fm = FileManager()
     fm.caller_dir = tmp_path
+    caplog.set_level(logging.INFO, logger="pyAdmin.FileManager")
     
     result = fm.compress_files(["non_existent.txt"], "empty.zip")
-    captured = capsys.readouterr()
-    assert "created with 0 files" in captured.out
+    assert "created with 0 files" in caplog.text
     assert result is False
 
-def test_metadata_nonexistent_file(tmp_path, capsys):
+def test_metadata_nonexistent_file(tmp_path, caplog):
     fm = FileManager()
     fm.caller_dir = tmp_path
     
     meta = fm.get_file_metadata("ghost.file")
-    captured = capsys.readouterr()
-    assert "not found" in captured.out
+    assert "not found" in caplog.text
     assert meta == {}
 
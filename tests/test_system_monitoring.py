@@ -1,19 +1,31 @@
+import gc
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
 import pytest
+from collections import namedtuple
 from unittest.mock import Mock, patch
 from datetime import datetime
 from pyAdmin.system_monitoring import SystemMonitor
 import psutil
 
+cpu_times = namedtuple('scputimes', ['user', 'system', 'idle', 'iowait'])
+
 @pytest.fixture
 def mock_psutil():
     with patch('pyAdmin.system_monitoring.psutil') as mock:
+        mock.cpu_times.return_value = cpu_times(0.0, 0.0, 0.0, 0.0)
         yield mock
 
-def test_psutil_not_installed():
+def test_psutil_not_installed(caplog):
     with patch.dict('sys.modules', {'psutil': None}):
         monitor = SystemMonitor()
         assert not monitor.psutil_available
         assert monitor.get_system_status() == {}
+    assert "pip install psutil" in caplog.text
 
 def test_full_system_status(mock_psutil):
     # Configure mock values
@@ -23,7 +35,10 @@ def test_full_system_status(mock_psutil):
     mock_psutil.virtual_memory.return_value = Mock(
         total=16000000000, available=8000000000, used=8000000000, percent=50.0
     )
-    mock_psutil.cpu_percent.return_value = 25.5
+    # Каждый замер: 25.5 с занято из 100 (init, parallel, serial)
+    mock_psutil.cpu_times.side_effect = [
+        cpu_times(25.5 * n, 0.0, 74.5 * n, 0.0) for n in range(3)
+    ]
     mock_psutil.cpu_count.side_effect = [4, 8]  # physical, logical
     mock_psutil.net_io_counters.return_value = Mock(
         bytes_sent=1000, bytes_recv=2000, packets_sent=10, packets_recv=20
@@ -37,9 +52,14 @@ def test_full_system_status(mock_psutil):
         'coretemp': [Mock(label='Core 0', current=45.0, high=90.0, critical=100.0)]
     }
     mock_psutil.pids.return_value = [1, 2, 3]
+    mock_psutil.LINUX = False
 
     monitor = SystemMonitor()
     status = monitor.get_system_status()
+    serial = monitor.get_system_status(parallel=False)
+    assert serial.keys() == status.keys()
+    assert serial['disk'] == status['disk'] and serial['cpu'] == status['cpu']
+    monitor.close()
 
     # Disk
     assert status['disk']['total_gb'] == 0.93
@@ -102,4 +122,101 @@ def test_cpu_frequency_unavailable(mock_psutil):
 def test_empty_temperature_data(mock_psutil):
     mock_psutil.sensors_temperatures.return_value = {}
     monitor = SystemMonitor()
-    assert monitor._get_temperatures() == {}
\ No newline at end of file
+    assert monitor._get_temperatures() == {}
+
+def test_cpu_usage_non_blocking(mock_psutil):
+    mock_psutil.cpu_times.side_effect = [
+        cpu_times(10.0, 5.0, 80.0, 5.0),   # базовый замер при создании
+        cpu_times(20.0, 7.5, 160.0, 12.5)  # 12.5 из 100 с занято
+    ]
+    monitor = SystemMonitor()
+    assert monitor._get_cpu_usage()['usage_percent'] == 12.5
+    assert not mock_psutil.cpu_percent.called
+
+def test_cpu_usage_across_threads():
+    """Загрузка CPU без моков: замеры в разных потоках пула не обнуляются"""
+    load = [
+        subprocess.Popen([sys.executable, "-c", "while True: pass"])
+        for _ in range(min(os.cpu_count() or 1, 2))
+    ]
+    try:
+        monitor = SystemMonitor()
+        readings = []
+        for _ in range(5):
+            time.sleep(0.1)
+            readings.append(monitor.get_system_status()['cpu']['usage_percent'])
+        time.sleep(0.1)
+        serial = monitor._get_cpu_usage()['usage_percent']
+        monitor.close()
+    finally:
+        for process in load:
+            process.kill()
+            process.wait()
+    assert all(0.0 < value <= 100.0 for value in readings), readings
+    assert 0.0 < serial <= 100.0
+
+def test_cpu_invariants_cached(mock_psutil):
+    mock_psutil.cpu_count.side_effect = [4, 8]
+    mock_psutil.cpu_freq.return_value = Mock(current=3.6)
+    monitor = SystemMonitor()
+    first = monitor._get_cpu_usage()
+    second = monitor._get_cpu_usage()
+
+    assert first['cores'] == second['cores'] == 4
+    assert first['threads'] == second['threads'] == 8
+    assert second['frequency'] == 3.6
+    assert mock_psutil.cpu_count.call_count == 2
+    assert mock_psutil.cpu_freq.call_count == 1
+
+def test_system_status_error_propagates(mock_psutil):
+    mock_psutil.disk_usage.side_effect = PermissionError("denied")
+    monitor = SystemMonitor()
+    with pytest.raises(PermissionError):
+        monitor.get_system_status()
+    monitor.close()
+
+def test_pool_threads_released():
+    """Потоки пула освобождаются при выходе из with и при сборке монитора"""
+    def pool_threads():
+        return [t for t in threading.enumerate() if t.name.startswith("SystemMonitor")]
+
+    with SystemMonitor() as monitor:
+        monitor.get_system_status()
+        assert pool_threads()
+    assert not pool_threads()
+
+    monitor = SystemMonitor()
+    monitor.get_system_status()
+    threads = pool_threads()
+    del monitor
+    gc.collect()
+    for thread in threads:
+        thread.join(timeout=2)
+    assert not pool_threads()
+
+@pytest.mark.skipif(not psutil.LINUX, reason="/proc есть только в Linux")
+def test_process_count_from_proc():
+    monitor = SystemMonitor()
+    assert abs(monitor._get_process_count() - len(psutil.pids())) <= 5
+
+def test_temperature_arrays(mock_psutil):
+    mock_psutil.sensors_temperatures.return_value = {
+        'coretemp': [
+            Mock(label='Core 0', current=45.5, high=90.0, critical=None),
+            Mock(label='Core 1', current=47.0, high=None, critical=100.0)
+        ]
+    }
+    monitor = SystemMonitor()
+    temps = monitor.get_temperature_arrays()['coretemp']
+
+    assert temps['labels'] == ['Core 0', 'Core 1']
+    assert list(temps['current']) == [45.5, 47.0]
+    assert temps['high'][0] == 90.0 and math.isnan(temps['high'][1])
+    assert math.isnan(temps['critical'][0]) and temps['critical'][1] == 100.0
+
+    mock_psutil.sensors_temperatures.side_effect = AttributeError
+    assert monitor.get_temperature_arrays() == {}
+
+def test_check_psutil_fast_path():
+    with patch('builtins.__import__', side_effect=AssertionError("import called")):
+        assert SystemMonitor._check_psutil() is True